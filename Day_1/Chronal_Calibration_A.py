@@ -44,12 +44,18 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from Day_1.parser import parse_changes
+from utils import File
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
+PARSER_LINES = "lines"
+PARSER_BULK = "bulk"
+PARSER = PARSER_BULK
 
 
 #######################################################################################################################
@@ -76,9 +82,12 @@ def process_data(data):
 # Main function
 #######################################################################################################################
 def __main__():
-    runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
-
-    iterations = process_data(runner.input_data)
+    if PARSER == PARSER_BULK:
+        runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True, input_mode=File.MODE_BLOCKS)
+        iterations = parse_changes(b"".join(runner.input_data))
+    else:
+        runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
+        iterations = process_data(runner.input_data)
 
     frequency = 0
     frequency = calculate_frequency(frequency, iterations)
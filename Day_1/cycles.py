@@ -0,0 +1,51 @@
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def first_pass_repeat(start_frequency, iterations):
+    # First repeated frequency within the first pass over the changes, or None
+    frequency = start_frequency
+    visited = {start_frequency}
+    for iteration in iterations:
+        frequency += iteration
+        if frequency in visited:
+            return frequency
+        visited.add(frequency)
+
+    return None
+
+
+def first_repeat(start_frequency, iterations):
+    # Pass t reaches frequency f_i + t * drift at change i, where f_i are the frequencies of the first pass. Without
+    # a repeat in the first pass, f_j later meets f_i only if both share their residue modulo the drift, after
+    # (f_i - f_j) / drift passes. Within each residue class the earliest meeting is with the next frequency in the
+    # direction of the drift, so sorting the classes finds the first repeat in O(n log n) without simulating passes.
+    repeat = first_pass_repeat(start_frequency, iterations)
+    # A zero drift brings the first pass back to the start frequency, so it has always repeated by then
+    if repeat is not None or not iterations:
+        return repeat
+
+    frequencies = []
+    frequency = start_frequency
+    for iteration in iterations:
+        frequency += iteration
+        frequencies.append(frequency)
+    drift = frequency - start_frequency
+    direction = 1 if drift > 0 else -1
+
+    # The start frequency can be met, but it never moves on its own: its next passes are those of the last change
+    classes = {}
+    for position, frequency in enumerate([start_frequency] + frequencies, -1):
+        classes.setdefault(frequency % abs(drift), []).append([frequency * direction, position])
+
+    best = None
+    for members in classes.values():
+        members.sort()
+        for [lower, position], [upper, other_position] in zip(members, members[1:]):
+            if position == -1:
+                continue
+            candidate = [(upper - lower) // abs(drift), position, upper * direction]
+            if best is None or candidate < best:
+                best = candidate
+
+    # No two frequencies share a residue: the frequencies drift forever without repeating
+    return best[2] if best else None
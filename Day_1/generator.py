@@ -0,0 +1,42 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+DEFAULT_CYCLES = 150
+BASE_CHANGES = 1000
+MIN_CHANGES = 3
+SPREAD = 100
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def format_change(change):
+    if change < 0:
+        return str(change)
+    return "+" + str(change)
+
+
+def generate(scale=1, seed=DEFAULT_SEED, cycles=DEFAULT_CYCLES):
+    # Frequencies of the first pass get distinct residues modulo the drift, except for one planted pair that lies
+    # exactly `cycles` drifts apart. That pair is the only one that can ever meet, so the first repeated frequency
+    # is found after `cycles` passes over the list, like in the real input.
+    generator = random.Random(seed)
+    changes_number = max(int(BASE_CHANGES * scale), MIN_CHANGES)
+    drift = generator.randint(changes_number, 2 * changes_number)
+
+    residues = generator.sample(range(1, drift), changes_number - 1)
+    frequencies = [residue + drift * generator.randint(-SPREAD, SPREAD) for residue in residues]
+    lower, upper = generator.sample(range(len(frequencies)), 2)
+    frequencies[upper] = frequencies[lower] + cycles * drift
+
+    drift *= generator.choice([-1, 1])
+    previous = 0
+    for frequency in frequencies + [drift]:
+        yield format_change(frequency - previous)
+        previous = frequency
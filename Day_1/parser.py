@@ -0,0 +1,41 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import array
+import warnings
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+INT64_LIMITS = [-2 ** 63, 2 ** 63 - 1]
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def parse_changes(text):
+    # Whole input (str or bytes) to an array('q') of signed changes in one pass; int() reads "+5" and "-5" directly
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode()
+    numbers = text.split()
+
+    if numpy is not None:
+        changes = array.array('q')
+        try:
+            # NumPy only warns and stops early on malformed input, which is left to int() to report
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                values = numpy.fromstring(text, dtype=numpy.int64, sep=" ")
+        except (DeprecationWarning, ValueError):
+            values = None
+        # NumPy also reads "+ 1" or blank text as numbers and saturates on overflow: such input is left to int() too
+        if values is not None and len(values) == len(numbers) and not numpy.isin(values, INT64_LIMITS).any():
+            changes.frombytes(values.tobytes())
+            return changes
+
+    return array.array('q', map(int, numbers))
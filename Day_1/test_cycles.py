@@ -0,0 +1,65 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import itertools
+import random
+import unittest
+
+from Day_1.cycles import first_repeat
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+# Examples of the puzzle statement: changes -> first frequency reached twice
+EXAMPLES = [
+    [[1, -1], 0],
+    [[3, 3, 4, -2, -4], 10],
+    [[-6, 3, 8, 5, -6], 5],
+    [[7, 7, -2, -7, -4], 14],
+]
+SEED = 2018
+RANDOM_CASES = 2000
+SIMULATION_LIMIT = 20000
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def simulate(start_frequency, iterations):
+    # Replays the changes for a bounded number of steps; None when nothing repeated by then
+    frequency = start_frequency
+    visited = {start_frequency}
+    for iteration in itertools.islice(itertools.cycle(iterations), SIMULATION_LIMIT):
+        frequency += iteration
+        if frequency in visited:
+            return frequency
+        visited.add(frequency)
+
+    return None
+
+
+class TestFirstRepeat(unittest.TestCase):
+    def test_examples(self):
+        for iterations, expected in EXAMPLES:
+            self.assertEqual(first_repeat(0, iterations), expected)
+
+    def test_never_repeats(self):
+        self.assertIsNone(first_repeat(0, [1]))
+        self.assertIsNone(first_repeat(0, [2, 3]))
+        self.assertIsNone(first_repeat(0, []))
+
+    def test_random_changes(self):
+        # Small changes, so that many frequencies share a residue modulo the drift and meet after several passes
+        generator = random.Random(SEED)
+        for i in range(RANDOM_CASES):
+            iterations = [generator.randint(-6, 6) for j in range(generator.randint(1, 8))]
+            start_frequency = generator.randint(-5, 5)
+            with self.subTest(start_frequency=start_frequency, iterations=iterations):
+                self.assertEqual(first_repeat(start_frequency, iterations), simulate(start_frequency, iterations))
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
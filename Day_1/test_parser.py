@@ -0,0 +1,65 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+import unittest
+
+from Day_1 import parser
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+# Text -> parsed changes, or the error int() raises for it
+CASES = [
+    [b"+1\n-2\n+3\n", [1, -2, 3]],
+    [b"+1\r\n-2\r\n", [1, -2]],
+    [b"", []],
+    [b"\n", []],
+    [b" \n\t\n", []],
+    [b"+9223372036854775807\n-9223372036854775808\n", [2 ** 63 - 1, -2 ** 63]],
+    [b"+ 1", ValueError],
+    [b"+1\nabc\n", ValueError],
+    [b"1.5", ValueError],
+    [b"-9223372036854775809", OverflowError],
+    [b"+9223372036854775808", OverflowError],
+]
+SEED = 2018
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class TestParseChanges(unittest.TestCase):
+    def parse_both(self, text):
+        # [NumPy result, pure Python result], each a list or the type of the error raised
+        results = []
+        numpy = parser.numpy
+        for engine in [numpy, None]:
+            parser.numpy = engine
+            try:
+                results.append(list(parser.parse_changes(text)))
+            except (ValueError, OverflowError) as error:
+                results.append(type(error))
+            finally:
+                parser.numpy = numpy
+
+        return results
+
+    def test_cases(self):
+        for text, expected in CASES:
+            with self.subTest(text=text):
+                self.assertEqual(self.parse_both(text), [expected, expected])
+
+    def test_random_changes(self):
+        generator = random.Random(SEED)
+        changes = [generator.randint(-10 ** 6, 10 ** 6) for i in range(1000)]
+        text = "\n".join("{:+d}".format(change) for change in changes)
+        self.assertEqual(self.parse_both(text), [changes, changes])
+        self.assertEqual(self.parse_both(text.encode()), [changes, changes])
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
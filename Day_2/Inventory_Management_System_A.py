@@ -38,12 +38,20 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from Day_2.checksum import repeated_counts, repeated_counts_parallel, repeated_counts_vectorized
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
+ENGINE_COUNT = "count"
+ENGINE_COUNTER = "counter"
+ENGINE_VECTORIZED = "vectorized"
+ENGINE = ENGINE_VECTORIZED
+# More than one worker shards the IDs across processes, each counting its shard with the vectorized engine
+WORKERS = 1
 
 
 #######################################################################################################################
@@ -76,12 +84,21 @@ def calculate_repeated(data):
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
     runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
 
     # Your code goes here
-    repeats = calculate_repeated(runner.input_data)
-    checksum = repeats["Two"] * repeats["Three"]
+    if WORKERS > 1:
+        repeats = repeated_counts_parallel(runner.input_data, workers=WORKERS)
+        checksum = repeats[2] * repeats[3]
+    elif ENGINE == ENGINE_COUNTER:
+        repeats = repeated_counts(runner.input_data)
+        checksum = repeats[2] * repeats[3]
+    elif ENGINE == ENGINE_VECTORIZED:
+        repeats = repeated_counts_vectorized(runner.input_data)
+        checksum = repeats[2] * repeats[3]
+    else:
+        repeats = calculate_repeated(runner.input_data)
+        checksum = repeats["Two"] * repeats["Three"]
 
     runner.finish([checksum])
 
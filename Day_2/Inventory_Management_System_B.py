@@ -58,12 +58,21 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from Day_2.bk_tree import BKTree
+from Day_2.distances import pairs_within
+from Day_2.near_duplicates import first_one_off_pair
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
+ENGINE_PAIRS = "pairs"
+ENGINE_DELETION = "deletion"
+ENGINE_BK_TREE = "bk_tree"
+ENGINE_MATRIX = "matrix"
+ENGINE = ENGINE_DELETION
 
 
 #######################################################################################################################
@@ -87,12 +96,23 @@ def remove_diff_letter(str1, str2):
     return result
 
 
-def find_one_letter_diff_record(data):
+def find_one_letter_diff_pair(data):
     for i in range(len(data) - 1):
         for j in range(i + 1, len(data)):
             different_letters_count = compare_letters(data[i], data[j])
             if different_letters_count == 1:
-                return remove_diff_letter(data[i], data[j])
+                return [data[i], data[j]]
+
+    return None
+
+
+def find_bk_tree_pair(data):
+    tree = BKTree.build(data)
+    for record in data:
+        # Nearest first, so the record itself comes before its one-off matches
+        matches = tree.within(record, 1)[1:]
+        if matches:
+            return [record, matches[0][1]]
 
     return None
 
@@ -101,11 +121,21 @@ def find_one_letter_diff_record(data):
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
     runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
 
     # Your code goes here
-    result = find_one_letter_diff_record(runner.input_data)
+    if ENGINE == ENGINE_DELETION:
+        pair = first_one_off_pair(runner.input_data)
+    elif ENGINE == ENGINE_BK_TREE:
+        pair = find_bk_tree_pair(runner.input_data)
+    elif ENGINE == ENGINE_MATRIX:
+        pair = next(pairs_within(runner.input_data, 1), None)
+    else:
+        pair = find_one_letter_diff_pair(runner.input_data)
+
+    if pair is None:
+        raise ValueError("no two box IDs differ by exactly one letter")
+    result = remove_diff_letter(*pair)
 
     runner.finish([result])
 
@@ -0,0 +1,109 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import pickle
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+METRIC_HAMMING = "hamming"
+METRIC_LEVENSHTEIN = "levenshtein"
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def hamming(first, second):
+    # IDs of different lengths differ by every missing character as well, which keeps this a metric
+    return sum(1 for a, b in zip(first, second) if not a == b) + abs(len(first) - len(second))
+
+
+def levenshtein(first, second):
+    previous = list(range(len(second) + 1))
+    for i, a in enumerate(first, 1):
+        current = [i]
+        for j, b in enumerate(second, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (not a == b)))
+        previous = current
+
+    return previous[-1]
+
+
+METRICS = {
+    METRIC_HAMMING: hamming,
+    METRIC_LEVENSHTEIN: levenshtein,
+}
+
+
+class BKTree:
+    # Burkhard-Keller tree: the children of a node are keyed by their distance to it. By the triangle inequality,
+    # IDs within radius of a probe can only sit under children keyed distance(probe, node) +- radius, so a query
+    # skips every other subtree. Nodes are kept in flat lists, so neither building, querying nor pickling recurses.
+    def __init__(self, metric=METRIC_HAMMING):
+        self.metric = metric
+        self.distance = METRICS[metric]
+        self.words = []
+        # Node -> {distance: child node}
+        self.children = []
+
+    @classmethod
+    def build(cls, words, metric=METRIC_HAMMING):
+        tree = cls(metric)
+        for word in words:
+            tree.add(word)
+
+        return tree
+
+    def add(self, word):
+        if not self.words:
+            self.words.append(word)
+            self.children.append({})
+            return
+
+        node = 0
+        while True:
+            distance = self.distance(word, self.words[node])
+            if distance == 0:
+                return
+            child = self.children[node].get(distance)
+            if child is None:
+                self.children[node][distance] = len(self.words)
+                self.words.append(word)
+                self.children.append({})
+                return
+            node = child
+
+    def within(self, word, radius):
+        # [distance, word] of every stored word at most radius away from word, nearest first
+        if not self.words:
+            return []
+
+        result = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = self.distance(word, self.words[node])
+            if distance <= radius:
+                result.append([distance, self.words[node]])
+            for child_distance, child in self.children[node].items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+
+        return sorted(result)
+
+    def save(self, file_name):
+        with open(file_name, 'wb') as tree_file:
+            pickle.dump([self.metric, self.words, self.children], tree_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, file_name):
+        with open(file_name, 'rb') as tree_file:
+            metric, words, children = pickle.load(tree_file)
+
+        tree = cls(metric)
+        tree.words = words
+        tree.children = children
+        return tree
+
+    def __len__(self):
+        return len(self.words)
@@ -0,0 +1,91 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import collections
+import concurrent.futures
+import functools
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+EXACT_COUNTS = (2, 3)
+ALPHABET_SIZE = 256
+# Rows histogrammed at once by the vectorized engine: bounds its memory to about BLOCK_ROWS * 2 KiB
+BLOCK_ROWS = 4096
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def check_exact_counts(exact_counts):
+    # A letter held zero times depends on the alphabet, not on the ID, so only k >= 1 is counted
+    if any(k < 1 for k in exact_counts):
+        raise ValueError("exact counts must be at least 1, got " + str(list(exact_counts)))
+
+
+def repeated_counts(box_ids, exact_counts=EXACT_COUNTS):
+    # Number of IDs holding some letter exactly k times, for every k: one Counter pass per ID
+    check_exact_counts(exact_counts)
+    totals = dict.fromkeys(exact_counts, 0)
+    wanted = set(exact_counts)
+    for box_id in box_ids:
+        for k in wanted.intersection(collections.Counter(box_id).values()):
+            totals[k] += 1
+
+    return totals
+
+
+def encode(box_ids):
+    # IDs as rows of a uint8 matrix, or None when they are not all single-byte characters of the same length
+    if not box_ids:
+        return None
+    length = len(box_ids[0])
+    data = "".join(box_ids).encode()
+    if not len(data) == len(box_ids) * length or any(not len(box_id) == length for box_id in box_ids):
+        return None
+
+    return numpy.frombuffer(data, dtype=numpy.uint8).reshape(len(box_ids), length)
+
+
+def repeated_counts_vectorized(box_ids, exact_counts=EXACT_COUNTS):
+    # Same as repeated_counts, with every letter histogram of a block of IDs built by a single bincount
+    check_exact_counts(exact_counts)
+    box_ids = list(box_ids)
+    matrix = encode(box_ids) if numpy is not None else None
+    if matrix is None:
+        return repeated_counts(box_ids, exact_counts)
+
+    totals = dict.fromkeys(exact_counts, 0)
+    for start in range(0, len(matrix), BLOCK_ROWS):
+        block = matrix[start:start + BLOCK_ROWS]
+        offsets = numpy.arange(len(block), dtype=numpy.int64)[:, None] * ALPHABET_SIZE
+        histograms = numpy.bincount((block + offsets).ravel(), minlength=len(block) * ALPHABET_SIZE)
+        histograms = histograms.reshape(len(block), ALPHABET_SIZE)
+        for k in exact_counts:
+            totals[k] += int(numpy.count_nonzero((histograms == k).any(axis=1)))
+
+    return totals
+
+
+def repeated_counts_parallel(box_ids, exact_counts=EXACT_COUNTS, workers=None, chunks=None):
+    # IDs are counted independently, so shards are counted in worker processes and their totals added up
+    check_exact_counts(exact_counts)
+    box_ids = list(box_ids)
+    workers = workers or os.cpu_count()
+    chunks = max(min(chunks or workers, len(box_ids)), 1)
+    chunk_size = max(-(-len(box_ids) // chunks), 1)
+    parts = [box_ids[i:i + chunk_size] for i in range(0, len(box_ids), chunk_size)]
+
+    totals = dict.fromkeys(exact_counts, 0)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(functools.partial(repeated_counts_vectorized, exact_counts=exact_counts), parts):
+            for k, count in part.items():
+                totals[k] += count
+
+    return totals
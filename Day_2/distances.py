@@ -0,0 +1,78 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+from Day_2.checksum import encode
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+# Rows compared at once: a block pair holds BLOCK_SIZE * BLOCK_SIZE * L comparison bytes, 6.5 MiB for 26 letters
+BLOCK_SIZE = 512
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def block_distances(matrix, block_size=BLOCK_SIZE):
+    # [row start, column start, Hamming distances] for every block of the upper triangle, column blocks included
+    for row_start in range(0, len(matrix), block_size):
+        rows = matrix[row_start:row_start + block_size]
+        for column_start in range(row_start, len(matrix), block_size):
+            columns = matrix[column_start:column_start + block_size]
+            distances = (rows[:, None, :] != columns[None, :, :]).sum(axis=2, dtype=numpy.uint16)
+            yield row_start, column_start, distances
+
+
+def distance_matrix(box_ids, block_size=BLOCK_SIZE):
+    # Dense symmetric Hamming distances between IDs of the same length, filled block by block
+    if numpy is None:
+        raise ValueError("a distance matrix needs NumPy, use pairs_within to list close pairs without it")
+    matrix = encode(list(box_ids))
+    if matrix is None:
+        raise ValueError("box IDs must be single-byte characters of the same length")
+
+    result = numpy.zeros((len(matrix), len(matrix)), dtype=numpy.uint16)
+    for row_start, column_start, distances in block_distances(matrix, block_size):
+        rows, columns = distances.shape
+        result[row_start:row_start + rows, column_start:column_start + columns] = distances
+        result[column_start:column_start + columns, row_start:row_start + rows] = distances.T
+
+    return result
+
+
+def pairs_within(box_ids, threshold, block_size=BLOCK_SIZE):
+    # Every pair of IDs at Hamming distance 1..threshold, ordered by their positions in box_ids
+    box_ids = list(box_ids)
+    matrix = encode(box_ids) if numpy is not None else None
+    if matrix is None:
+        yield from pairs_within_lists(box_ids, threshold)
+        return
+
+    # Blocks come row block by row block, so the pairs of a row block are sorted once all its blocks are in
+    pairs = []
+    for row_start, column_start, distances in block_distances(matrix, block_size):
+        close = (distances >= 1) & (distances <= threshold)
+        if row_start == column_start:
+            close = numpy.triu(close, k=1)
+        rows, columns = numpy.nonzero(close)
+        pairs.extend(zip((rows + row_start).tolist(), (columns + column_start).tolist()))
+
+        if column_start + block_size >= len(matrix):
+            for i, j in sorted(pairs):
+                yield [box_ids[i], box_ids[j]]
+            pairs = []
+
+
+def pairs_within_lists(box_ids, threshold):
+    for i in range(len(box_ids) - 1):
+        for j in range(i + 1, len(box_ids)):
+            if not len(box_ids[i]) == len(box_ids[j]):
+                continue
+            distance = sum(1 for a, b in zip(box_ids[i], box_ids[j]) if not a == b)
+            if 1 <= distance <= threshold:
+                yield [box_ids[i], box_ids[j]]
@@ -0,0 +1,37 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+import string
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+BASE_IDS = 250
+ID_LENGTH = 26
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def random_id(generator):
+    return "".join(generator.choice(string.ascii_lowercase) for i in range(ID_LENGTH))
+
+
+def generate(scale=1, seed=DEFAULT_SEED):
+    # Exactly one pair of IDs differs by a single letter; random IDs of this length practically never do.
+    generator = random.Random(seed)
+    ids_number = max(int(BASE_IDS * scale), 2)
+    first, second = sorted(generator.sample(range(ids_number), 2))
+
+    planted_id = None
+    for i in range(ids_number):
+        box_id = random_id(generator)
+        if i == first:
+            planted_id = box_id
+        elif i == second:
+            position = generator.randrange(ID_LENGTH)
+            letter = generator.choice(string.ascii_lowercase.replace(planted_id[position], ""))
+            box_id = planted_id[:position] + letter + planted_id[position + 1:]
+        yield box_id
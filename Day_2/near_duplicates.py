@@ -0,0 +1,38 @@
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def deletion_key(box_id, position):
+    # Two IDs of the same length differ at most at this position exactly when their keys are equal
+    return box_id[:position] + box_id[position + 1:]
+
+
+def first_one_off_pair(box_ids):
+    # One hash lookup per ID and position instead of comparing every pair: O(n * L) lookups
+    seen = {}
+    for box_id in box_ids:
+        for position in range(len(box_id)):
+            key = (position, deletion_key(box_id, position))
+            other_id = seen.setdefault(key, box_id)
+            if not other_id == box_id:
+                return [other_id, box_id]
+
+    return None
+
+
+def one_off_pairs(box_ids):
+    # Every pair of IDs at Hamming distance 1. Positions are indexed one at a time, so memory stays O(n) whatever
+    # the ID length; a pair differs at a single position, so it is found exactly once.
+    box_ids = list(box_ids)
+    length = max(map(len, box_ids), default=0)
+
+    for position in range(length):
+        groups = {}
+        for box_id in box_ids:
+            if position < len(box_id):
+                groups.setdefault(deletion_key(box_id, position), []).append(box_id)
+
+        for group in groups.values():
+            for i in range(len(group) - 1):
+                for j in range(i + 1, len(group)):
+                    if not group[i] == group[j]:
+                        yield [group[i], group[j]]
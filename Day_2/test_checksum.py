@@ -0,0 +1,47 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+import unittest
+
+from Day_2 import checksum
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+SAMPLE = ["abcdef", "bababc", "abbcde", "abcccd", "aabcdd", "abcdee", "ababab"]
+EXACT_COUNTS = (1, 2, 3, 4)
+SEED = 2018
+RANDOM_CASES = 200
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class TestRepeatedCounts(unittest.TestCase):
+    def test_sample(self):
+        self.assertEqual(checksum.repeated_counts(SAMPLE), {2: 4, 3: 3})
+        self.assertEqual(checksum.repeated_counts_vectorized(SAMPLE), {2: 4, 3: 3})
+
+    def test_random_ids(self):
+        # Same-length IDs take the NumPy path, ragged ones its fallback
+        generator = random.Random(SEED)
+        for i in range(RANDOM_CASES):
+            length = generator.randint(1, 8)
+            box_ids = ["".join(generator.choice("abc") for k in range(length if i % 2 else generator.randint(1, 8)))
+                       for j in range(generator.randrange(30))]
+            with self.subTest(box_ids=box_ids):
+                self.assertEqual(checksum.repeated_counts_vectorized(box_ids, EXACT_COUNTS),
+                                 checksum.repeated_counts(box_ids, EXACT_COUNTS))
+
+    def test_rejects_zero(self):
+        for engine in [checksum.repeated_counts, checksum.repeated_counts_vectorized]:
+            with self.assertRaises(ValueError):
+                engine(["aab"], (0, 2))
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+import unittest
+
+from Day_2 import distances
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+SEED = 2018
+RANDOM_CASES = 300
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class TestPairsWithin(unittest.TestCase):
+    def test_random_ids(self):
+        # Tiny blocks, so that pairs spread over many row and column blocks
+        generator = random.Random(SEED)
+        for i in range(RANDOM_CASES):
+            length = generator.randint(1, 4)
+            box_ids = ["".join(generator.choice("abc") for k in range(length)) for j in range(generator.randrange(40))]
+            threshold = generator.randint(1, 3)
+            block_size = generator.randint(1, 9)
+            with self.subTest(box_ids=box_ids, threshold=threshold, block_size=block_size):
+                self.assertEqual(list(distances.pairs_within(box_ids, threshold, block_size)),
+                                 list(distances.pairs_within_lists(box_ids, threshold)))
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import itertools
+import random
+import unittest
+
+from Day_2.near_duplicates import first_one_off_pair, one_off_pairs
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+SAMPLE = ["abcde", "fghij", "klmno", "pqrst", "fguij", "axcye", "wvxyz"]
+SEED = 2018
+RANDOM_CASES = 300
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def random_ids(generator):
+    # Two letters and short, mixed lengths: one-off pairs, duplicates and near misses of other lengths are common
+    return ["".join(generator.choice("ab") for j in range(generator.randint(1, 5)))
+            for i in range(generator.randrange(12))]
+
+
+def brute_force_pairs(box_ids):
+    return sorted(sorted(pair) for pair in itertools.combinations(box_ids, 2)
+                  if len(pair[0]) == len(pair[1]) and sum(1 for a, b in zip(*pair) if not a == b) == 1)
+
+
+class TestNearDuplicates(unittest.TestCase):
+    def test_sample(self):
+        self.assertEqual(first_one_off_pair(SAMPLE), ["fghij", "fguij"])
+        self.assertEqual(list(one_off_pairs(SAMPLE)), [["fghij", "fguij"]])
+
+    def test_no_pair(self):
+        self.assertIsNone(first_one_off_pair(["abc", "abc", "xyz"]))
+        self.assertIsNone(first_one_off_pair([]))
+        self.assertEqual(list(one_off_pairs(["abc", "abc", "xyz"])), [])
+
+    def test_random_ids(self):
+        generator = random.Random(SEED)
+        for i in range(RANDOM_CASES):
+            box_ids = random_ids(generator)
+            with self.subTest(box_ids=box_ids):
+                expected = brute_force_pairs(box_ids)
+                self.assertEqual(sorted(sorted(pair) for pair in one_off_pairs(box_ids)), expected)
+                pair = first_one_off_pair(box_ids)
+                if expected:
+                    self.assertIn(sorted(pair), expected)
+                else:
+                    self.assertIsNone(pair)
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -54,18 +54,31 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from Day_3.compression import compressed_area_at_least
+from Day_3.coverage import area_at_least, coverage
+from Day_3.fabric import Fabric
+from Day_3.overlap import overlapping_pairs
+from Day_3.parser import parse_claims
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
+ENGINE_OVERLAPS = "overlaps"
+ENGINE_COVERAGE = "coverage"
+ENGINE_COMPRESSED = "compressed"
+ENGINE = ENGINE_COVERAGE
 
 
 #######################################################################################################################
 # Root function
 #######################################################################################################################
 class Overlap:
+    # Slots instead of a per-instance __dict__: calculate_overlaps can create millions of these
+    __slots__ = ["start_x", "end_x", "start_y", "end_y"]
+
     def __init__(self, start_x, end_x, start_y, end_y):
         self.start_x = start_x
         self.end_x = end_x
@@ -78,6 +91,8 @@ class Overlap:
 
 
 class Claim:
+    __slots__ = ["id", "cut_left", "cut_top", "width", "height", "start_x", "end_x", "start_y", "end_y"]
+
     def __init__(self, id_nr, cut_left, cut_top, width, height):
         self.id = id_nr
         self.cut_left = cut_left
@@ -92,37 +107,11 @@ class Claim:
         self.end_y = cut_top + height - 1
 
     def overlap(self, claim):
-        if self.start_x <= claim.start_x <= self.end_x:
-            if self.start_y <= claim.start_y <= self.end_y:
-                x1, x2, y1, y2 = claim.start_x, self.end_x, claim.start_y, self.end_y
-                if claim.end_x < self.end_x:
-                    x2 = claim.end_x
-                if claim.end_y < self.end_y:
-                    y2 = claim.end_y
-
-                return Overlap(x1, x2, y1, y2)
-            if self.start_y <= claim.end_y <= self.end_y:
-                x1, x2, y1, y2 = claim.start_x, self.end_x, self.start_y, claim.end_y
-                if claim.end_x < self.end_x:
-                    x2 = claim.end_x
-
-                return Overlap(x1, x2, y1, y2)
-        if self.start_x <= claim.end_x <= self.end_x:
-            if self.start_y <= claim.start_y <= self.end_y:
-                x1, x2, y1, y2 = self.start_x, claim.end_x, claim.start_y, self.end_y
-                if claim.end_y < self.end_y:
-                    y2 = claim.end_y
-
-                return Overlap(x1, x2, y1, y2)
-            if self.start_y <= claim.end_y <= self.end_y:
-                x1, x2, y1, y2 = self.start_x, claim.end_x, self.start_y, claim.end_y
-
-                return Overlap(x1, x2, y1, y2)
-        if self.start_x <= claim.start_x <= self.end_x and self.start_x <= claim.end_x <= self.end_x:
-            if claim.start_y < self.start_y and claim.end_y > self.end_y:
-                x1, x2, y1, y2 = claim.start_x, claim.end_x, self.start_y, self.end_y
-
-                return Overlap(x1, x2, y1, y2)
+        start_x, end_x = max(self.start_x, claim.start_x), min(self.end_x, claim.end_x)
+        start_y, end_y = max(self.start_y, claim.start_y), min(self.end_y, claim.end_y)
+
+        if start_x <= end_x and start_y <= end_y:
+            return Overlap(start_x, end_x, start_y, end_y)
 
         return None
 
@@ -169,13 +158,8 @@ def create_claims(data):
 def calculate_overlaps(claims):
     overlaps = []
 
-    for i in range(len(claims) - 1):
-        for j in range(i+1, len(claims)):
-            overlap = claims[i].overlap(claims[j])
-            if not overlap:
-                overlap = claims[j].overlap(claims[i])
-            if overlap:
-                overlaps.append(overlap)
+    for claim, other_claim in overlapping_pairs(claims):
+        overlaps.append(claim.overlap(other_claim))
 
     return overlaps
 
@@ -189,7 +173,7 @@ def initialize_matrix(plans):
         if plan.end_y > max_y:
             max_y = plan.end_y
 
-    matrix = [[False for j in range(max_x + 1)] for i in range(max_y + 1)]
+    matrix = Fabric(max_x + 1, max_y + 1)
 
     return matrix
 
@@ -198,47 +182,34 @@ def mapping(plans):
     matrix = initialize_matrix(plans)
 
     for plan in plans:
-        for i in range(plan.start_y, plan.end_y + 1):
-            for j in range(plan.start_x, plan.end_x + 1):
-                if not matrix[i][j]:
-                    matrix[i][j] = True
-
-    # for row in matrix:
-    #     row_str = ""
-    #     for cell in row:
-    #         if cell:
-    #             row_str += "x"
-    #         else:
-    #             row_str += "."
-    #     print(row_str)
+        matrix.set_range(plan.start_x, plan.end_x, plan.start_y, plan.end_y)
+
+    # print(matrix)
 
     return matrix
 
 
 def calculate_overlap_area(matrix):
-    area = 0
-
-    for row in matrix:
-        for cell in row:
-            if cell:
-                area += 1
-
-    return area
+    return matrix.count()
 
 
 #######################################################################################################################
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
     runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
 
     # Your code goes here
-    claims = create_claims(process_input(runner.input_data))
-    overlaps = calculate_overlaps(claims)
-
-    matrix = mapping(overlaps)
-    overlap_area = calculate_overlap_area(matrix)
+    if ENGINE == ENGINE_COVERAGE:
+        overlap_area = area_at_least(coverage(parse_claims("\n".join(runner.input_data))), 2)
+    elif ENGINE == ENGINE_COMPRESSED:
+        overlap_area = compressed_area_at_least(parse_claims("\n".join(runner.input_data)), 2)
+    else:
+        claims = create_claims(process_input(runner.input_data))
+        overlaps = calculate_overlaps(claims)
+
+        matrix = mapping(overlaps)
+        overlap_area = calculate_overlap_area(matrix)
 
     runner.finish([overlap_area])
 
@@ -61,18 +61,30 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from Day_3.coverage import coverage, uncontested
+from Day_3.index import ClaimIndex
+from Day_3.overlap import overlapping_pairs
+from Day_3.parser import parse_claims
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
+ENGINE_OVERLAPS = "overlaps"
+ENGINE_COVERAGE = "coverage"
+ENGINE_INDEX = "index"
+ENGINE = ENGINE_INDEX
 
 
 #######################################################################################################################
 # Root function
 #######################################################################################################################
 class Overlap:
+    # Slots instead of a per-instance __dict__: Claim.overlap can create millions of these
+    __slots__ = ["start_x", "end_x", "start_y", "end_y"]
+
     def __init__(self, start_x, end_x, start_y, end_y):
         self.start_x = start_x
         self.end_x = end_x
@@ -85,6 +97,8 @@ class Overlap:
 
 
 class Claim:
+    __slots__ = ["id", "cut_left", "cut_top", "width", "height", "start_x", "end_x", "start_y", "end_y", "is_overlap"]
+
     def __init__(self, id_nr, cut_left, cut_top, width, height):
         self.id = id_nr
         self.cut_left = cut_left
@@ -101,37 +115,11 @@ class Claim:
         self.is_overlap = False
 
     def overlap(self, claim):
-        if self.start_x <= claim.start_x <= self.end_x:
-            if self.start_y <= claim.start_y <= self.end_y:
-                x1, x2, y1, y2 = claim.start_x, self.end_x, claim.start_y, self.end_y
-                if claim.end_x < self.end_x:
-                    x2 = claim.end_x
-                if claim.end_y < self.end_y:
-                    y2 = claim.end_y
-
-                return Overlap(x1, x2, y1, y2)
-            if self.start_y <= claim.end_y <= self.end_y:
-                x1, x2, y1, y2 = claim.start_x, self.end_x, self.start_y, claim.end_y
-                if claim.end_x < self.end_x:
-                    x2 = claim.end_x
-
-                return Overlap(x1, x2, y1, y2)
-        if self.start_x <= claim.end_x <= self.end_x:
-            if self.start_y <= claim.start_y <= self.end_y:
-                x1, x2, y1, y2 = self.start_x, claim.end_x, claim.start_y, self.end_y
-                if claim.end_y < self.end_y:
-                    y2 = claim.end_y
-
-                return Overlap(x1, x2, y1, y2)
-            if self.start_y <= claim.end_y <= self.end_y:
-                x1, x2, y1, y2 = self.start_x, claim.end_x, self.start_y, claim.end_y
-
-                return Overlap(x1, x2, y1, y2)
-        if self.start_x <= claim.start_x <= self.end_x and self.start_x <= claim.end_x <= self.end_x:
-            if claim.start_y < self.start_y and claim.end_y > self.end_y:
-                x1, x2, y1, y2 = claim.start_x, claim.end_x, self.start_y, self.end_y
-
-                return Overlap(x1, x2, y1, y2)
+        start_x, end_x = max(self.start_x, claim.start_x), min(self.end_x, claim.end_x)
+        start_y, end_y = max(self.start_y, claim.start_y), min(self.end_y, claim.end_y)
+
+        if start_x <= end_x and start_y <= end_y:
+            return Overlap(start_x, end_x, start_y, end_y)
 
         return None
 
@@ -176,14 +164,9 @@ def create_claims(data):
 
 
 def determine_not_overlapped(claims):
-    for i in range(len(claims) - 1):
-        for j in range(i+1, len(claims)):
-            overlap = claims[i].overlap(claims[j])
-            if not overlap:
-                overlap = claims[j].overlap(claims[i])
-            if overlap:
-                claims[i].is_overlap = True
-                claims[j].is_overlap = True
+    for claim, other_claim in overlapping_pairs(claims):
+        claim.is_overlap = True
+        other_claim.is_overlap = True
 
     for claim in claims:
         if not claim.is_overlap:
@@ -196,13 +179,22 @@ def determine_not_overlapped(claims):
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
     runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
 
     # Your code goes here
-    claims = create_claims(process_input(runner.input_data))
-    claim = determine_not_overlapped(claims)
-
+    if ENGINE == ENGINE_OVERLAPS:
+        claim = determine_not_overlapped(create_claims(process_input(runner.input_data)))
+    else:
+        # The columnar claims are enough for the engines that only read coordinates
+        claims = parse_claims("\n".join(runner.input_data))
+        if ENGINE == ENGINE_COVERAGE:
+            claim = next(iter(uncontested(claims, coverage(claims))), None)
+        else:
+            index = ClaimIndex.bulk_load(claims)
+            claim = next((claim for claim in claims if not index.overlaps_any(claim.id)), None)
+
+    if claim is None:
+        raise ValueError("every claim overlaps another claim")
     runner.finish([claim.id])
 
 
@@ -0,0 +1,71 @@
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class CoverageTree:
+    # Segment tree over the elementary y segments between consecutive compressed edges. Every node keeps how many
+    # claims cover it as a whole and, for j = 0..k, the length of its span covered by at least j claims.
+    def __init__(self, edges, k):
+        self.edges = edges
+        self.k = k
+        self.segments = len(edges) - 1
+        self.cover = [0] * (4 * self.segments)
+        self.covered = [[0] * (k + 1) for i in range(4 * self.segments)]
+
+    def update(self, low, high, change, node=1, node_low=0, node_high=None):
+        # Adds change to the claims covering segments [low, high)
+        if node_high is None:
+            node_high = self.segments
+        if high <= node_low or node_high <= low:
+            return
+
+        if low <= node_low and node_high <= high:
+            self.cover[node] += change
+        else:
+            middle = (node_low + node_high) // 2
+            self.update(low, high, change, 2 * node, node_low, middle)
+            self.update(low, high, change, 2 * node + 1, middle, node_high)
+
+        self.pull(node, node_low, node_high)
+
+    def pull(self, node, node_low, node_high):
+        cover = self.cover[node]
+        covered = self.covered[node]
+        length = self.edges[node_high] - self.edges[node_low]
+
+        for j in range(self.k + 1):
+            if j <= cover:
+                covered[j] = length
+            elif node_high - node_low == 1:
+                covered[j] = 0
+            else:
+                covered[j] = self.covered[2 * node][j - cover] + self.covered[2 * node + 1][j - cover]
+
+    def length_at_least(self):
+        return self.covered[1][self.k]
+
+
+def compressed_area_at_least(claims, k):
+    # Area covered by at least k claims, swept over x with the y coordinates compressed to the claim edges. Memory
+    # grows with the number of claims only, whatever the size of the fabric.
+    if not claims:
+        return 0
+
+    y_edges = sorted(set([claim.start_y for claim in claims] + [claim.end_y + 1 for claim in claims]))
+    y_rank = {y: rank for rank, y in enumerate(y_edges)}
+    tree = CoverageTree(y_edges, k)
+
+    events = []
+    for claim in claims:
+        low, high = y_rank[claim.start_y], y_rank[claim.end_y + 1]
+        events.append([claim.start_x, 1, low, high])
+        events.append([claim.end_x + 1, -1, low, high])
+    events.sort()
+
+    area = 0
+    previous_x = events[0][0]
+    for x, change, low, high in events:
+        area += tree.length_at_least() * (x - previous_x)
+        previous_x = x
+        tree.update(low, high, change)
+
+    return area
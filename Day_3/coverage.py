@@ -0,0 +1,106 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import itertools
+
+from Day_3.parser import ClaimColumns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+INT16_LIMIT = 32767
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def fabric_size(claims):
+    width, height = 0, 0
+    for claim in claims:
+        width = max(width, claim.end_x + 1)
+        height = max(height, claim.end_y + 1)
+
+    return [width, height]
+
+
+def corner_arrays(claims):
+    # [start_x, start_y, end_x + 1, end_y + 1] of every claim as int64 arrays; columns are viewed without copying
+    if isinstance(claims, ClaimColumns):
+        lefts = numpy.frombuffer(claims.lefts, dtype=numpy.int64)
+        tops = numpy.frombuffer(claims.tops, dtype=numpy.int64)
+        return [lefts, tops, lefts + numpy.frombuffer(claims.widths, dtype=numpy.int64),
+                tops + numpy.frombuffer(claims.heights, dtype=numpy.int64)]
+
+    return [numpy.fromiter((claim.start_x for claim in claims), dtype=numpy.int64, count=len(claims)),
+            numpy.fromiter((claim.start_y for claim in claims), dtype=numpy.int64, count=len(claims)),
+            numpy.fromiter((claim.end_x + 1 for claim in claims), dtype=numpy.int64, count=len(claims)),
+            numpy.fromiter((claim.end_y + 1 for claim in claims), dtype=numpy.int64, count=len(claims))]
+
+
+def coverage(claims):
+    # Number of claims covering every square inch, as rows of y. Each claim adds +1/-1 at its four corners of a
+    # difference array; two cumulative sums turn it into coverage counts.
+    # Accepts Claim objects or ClaimColumns.
+    if numpy is None:
+        width, height = fabric_size(claims)
+        return coverage_lists(claims, width, height)
+
+    start_x, start_y, end_x, end_y = corner_arrays(claims)
+    width, height = int(end_x.max(initial=0)), int(end_y.max(initial=0))
+
+    dtype = numpy.int16 if len(claims) <= INT16_LIMIT else numpy.int32
+    counts = numpy.zeros((height + 1, width + 1), dtype=dtype)
+    numpy.add.at(counts, (start_y, start_x), 1)
+    numpy.add.at(counts, (start_y, end_x), -1)
+    numpy.add.at(counts, (end_y, start_x), -1)
+    numpy.add.at(counts, (end_y, end_x), 1)
+
+    counts.cumsum(axis=0, out=counts)
+    counts.cumsum(axis=1, out=counts)
+    return counts[:height, :width]
+
+
+def coverage_lists(claims, width, height):
+    counts = [[0] * (width + 1) for i in range(height + 1)]
+    for claim in claims:
+        counts[claim.start_y][claim.start_x] += 1
+        counts[claim.start_y][claim.end_x + 1] -= 1
+        counts[claim.end_y + 1][claim.start_x] -= 1
+        counts[claim.end_y + 1][claim.end_x + 1] += 1
+
+    rows = []
+    previous = [0] * (width + 1)
+    for row in counts[:height]:
+        previous = [above + current for above, current in zip(previous, itertools.accumulate(row))]
+        rows.append(previous[:width])
+
+    return rows
+
+
+def area_at_least(counts, k):
+    # Square inches covered by at least k claims
+    if numpy is not None and isinstance(counts, numpy.ndarray):
+        return int(numpy.count_nonzero(counts >= k))
+
+    return sum(1 for row in counts for cell in row if cell >= k)
+
+
+def uncontested(claims, counts):
+    # Claims whose every square inch has coverage 1: a prefix sum over the "coverage is 1" mask gives the number of
+    # such square inches inside any claim in O(1)
+    if numpy is not None and isinstance(counts, numpy.ndarray):
+        single = numpy.zeros((counts.shape[0] + 1, counts.shape[1] + 1), dtype=numpy.int64)
+        single[1:, 1:] = (counts == 1).cumsum(axis=0).cumsum(axis=1)
+
+        start_x, start_y, end_x, end_y = corner_arrays(claims)
+        inside = single[end_y, end_x] - single[start_y, end_x] - single[end_y, start_x] + single[start_y, start_x]
+        return [claims[i] for i in numpy.flatnonzero(inside == (end_x - start_x) * (end_y - start_y))]
+
+    return [claim for claim in claims
+            if all(counts[y][x] == 1
+                   for y in range(claim.start_y, claim.end_y + 1) for x in range(claim.start_x, claim.end_x + 1))]
@@ -0,0 +1,53 @@
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+# Number of set bits of every byte value, used with bytes.translate to count cells without a Python loop
+BIT_COUNTS = bytes(bin(value).count("1") for value in range(256))
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class Fabric:
+    # Grid of square inches packed one bit per cell, row after row; a row takes a whole number of bytes
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.row_size = (width + 7) // 8
+        self.cells = bytearray(self.row_size * height)
+
+    def set_range(self, start_x, end_x, start_y, end_y):
+        # Marks the rectangle with inclusive corners [start_x, start_y] and [end_x, end_y]
+        first_byte, last_byte = start_x // 8, end_x // 8
+        first_mask = (0xFF << (start_x % 8)) & 0xFF
+        last_mask = 0xFF >> (7 - end_x % 8)
+
+        for y in range(start_y, end_y + 1):
+            row = y * self.row_size
+            if first_byte == last_byte:
+                self.cells[row + first_byte] |= first_mask & last_mask
+            else:
+                self.cells[row + first_byte] |= first_mask
+                self.cells[row + first_byte + 1:row + last_byte] = b"\xff" * (last_byte - first_byte - 1)
+                self.cells[row + last_byte] |= last_mask
+
+    def get(self, x, y):
+        return bool(self.cells[y * self.row_size + x // 8] >> (x % 8) & 1)
+
+    def count(self):
+        return sum(self.cells.translate(BIT_COUNTS))
+
+    def __iter__(self):
+        # Coordinates [x, y] of the marked cells, row by row
+        for index, value in enumerate(self.cells):
+            if value:
+                y, first_x = divmod(index, self.row_size)
+                for bit in range(8):
+                    if value >> bit & 1:
+                        yield [first_x * 8 + bit, y]
+
+    def __str__(self):
+        rows = []
+        for y in range(self.height):
+            rows.append("".join("x" if self.get(x, y) else "." for x in range(self.width)))
+        return "\n".join(rows)
@@ -0,0 +1,89 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import math
+import random
+
+from Day_3.overlap import overlapping_pairs
+from Day_3.parser import ClaimRow
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+BASE_CLAIMS = 1300
+BASE_FABRIC = 1000
+MIN_SIZE = 10
+MAX_SIZE = 29
+# The free claim and two claims overlapping each other
+MIN_CLAIMS = 3
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def random_claim(generator, fabric):
+    width = generator.randint(MIN_SIZE, MAX_SIZE)
+    height = generator.randint(MIN_SIZE, MAX_SIZE)
+    return [generator.randint(0, fabric - width), generator.randint(0, fabric - height), width, height]
+
+
+def intersects(claim, other):
+    return (claim[0] < other[0] + other[2] and other[0] < claim[0] + claim[2] and
+            claim[1] < other[1] + other[3] and other[1] < claim[1] + claim[3])
+
+
+def near_claim(generator, fabric, other):
+    # Random claim intersecting other
+    width = generator.randint(MIN_SIZE, MAX_SIZE)
+    height = generator.randint(MIN_SIZE, MAX_SIZE)
+    return [generator.randint(max(other[0] - width + 1, 0), min(other[0] + other[2] - 1, fabric - width)),
+            generator.randint(max(other[1] - height + 1, 0), min(other[1] + other[3] - 1, fabric - height)),
+            width, height]
+
+
+def isolated(claims):
+    # Indexes of the claims overlapping no other claim
+    rows = [ClaimRow(i, left, left + width - 1, top, top + height - 1)
+            for i, [left, top, width, height] in enumerate(claims)]
+    overlapped = set()
+    for first, second in overlapping_pairs(rows):
+        overlapped.update([first.id, second.id])
+
+    return [i for i in range(len(claims)) if i not in overlapped]
+
+
+def generate(scale=1, seed=DEFAULT_SEED):
+    # The fabric grows with the square root of the scale to keep the claim density of the real input. One claim is
+    # kept clear of every other claim, and every other claim overlaps at least one more, so like in the real input
+    # part B has exactly one answer.
+    generator = random.Random(seed)
+    claims_number = max(int(BASE_CLAIMS * scale), MIN_CLAIMS)
+    fabric = int(BASE_FABRIC * math.sqrt(max(scale, 1)))
+
+    free_claim = random_claim(generator, fabric)
+    free_claim_id = generator.randint(1, claims_number)
+
+    claims = []
+    for i in range(claims_number - 1):
+        claim = random_claim(generator, fabric)
+        while intersects(claim, free_claim):
+            claim = random_claim(generator, fabric)
+        claims.append(claim)
+
+    # A claim that overlaps nothing is moved onto a claim that keeps an overlap, so no move can undo another
+    moved = isolated(claims)
+    anchors = sorted(set(range(len(claims))) - set(moved))
+    if not anchors:
+        anchors.append(moved.pop())
+    for i in moved:
+        other = claims[generator.choice(anchors)]
+        claim = near_claim(generator, fabric, other)
+        while intersects(claim, free_claim):
+            claim = near_claim(generator, fabric, other)
+        claims[i] = claim
+        anchors.append(i)
+
+    claims.insert(free_claim_id - 1, free_claim)
+    for claim_id, claim in enumerate(claims, 1):
+        yield "#{} @ {},{}: {}x{}".format(claim_id, *claim)
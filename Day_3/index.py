@@ -0,0 +1,108 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import pickle
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_BUCKET_SIZE = 32
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class ClaimIndex:
+    # Uniform grid of square buckets listing the ids of the claims touching them. Queries only look at the buckets
+    # under the queried area, so they cost about the number of claims nearby, not the number of claims. Only ids and
+    # rectangles are kept, which keeps the index small and quick to save and load.
+    def __init__(self, bucket_size=DEFAULT_BUCKET_SIZE):
+        self.bucket_size = bucket_size
+        self.buckets = {}
+        # Claim id -> [start_x, end_x, start_y, end_y]
+        self.rectangles = {}
+
+    @classmethod
+    def bulk_load(cls, claims, bucket_size=None):
+        # Without an explicit size, buckets are as large as an average claim, so most claims touch at most 4 buckets
+        if bucket_size is None and claims:
+            total = sum(max(claim.end_x - claim.start_x, claim.end_y - claim.start_y) + 1 for claim in claims)
+            bucket_size = max(total // len(claims), 1)
+
+        index = cls(bucket_size or DEFAULT_BUCKET_SIZE)
+        size = index.bucket_size
+        buckets = index.buckets
+        rectangles = index.rectangles
+        for claim in claims:
+            rectangles[claim.id] = (claim.start_x, claim.end_x, claim.start_y, claim.end_y)
+            for bucket_y in range(claim.start_y // size, claim.end_y // size + 1):
+                for bucket_x in range(claim.start_x // size, claim.end_x // size + 1):
+                    bucket = buckets.get((bucket_x, bucket_y))
+                    if bucket is None:
+                        buckets[(bucket_x, bucket_y)] = [claim.id]
+                    else:
+                        bucket.append(claim.id)
+
+        return index
+
+    def add(self, claim):
+        self.rectangles[claim.id] = (claim.start_x, claim.end_x, claim.start_y, claim.end_y)
+        for key in self.bucket_keys(claim.start_x, claim.end_x, claim.start_y, claim.end_y):
+            self.buckets.setdefault(key, []).append(claim.id)
+
+    def bucket_keys(self, start_x, end_x, start_y, end_y):
+        size = self.bucket_size
+        for bucket_y in range(start_y // size, end_y // size + 1):
+            for bucket_x in range(start_x // size, end_x // size + 1):
+                yield bucket_x, bucket_y
+
+    def at(self, x, y):
+        # Ids of the claims covering the square inch [x, y]
+        found = []
+        for claim_id in self.buckets.get((x // self.bucket_size, y // self.bucket_size), []):
+            start_x, end_x, start_y, end_y = self.rectangles[claim_id]
+            if start_x <= x <= end_x and start_y <= y <= end_y:
+                found.append(claim_id)
+
+        return found
+
+    def in_rectangle(self, start_x, end_x, start_y, end_y):
+        # Ids of the claims touching the rectangle with inclusive corners [start_x, start_y] and [end_x, end_y]
+        found = set([])
+        for key in self.bucket_keys(start_x, end_x, start_y, end_y):
+            for claim_id in self.buckets.get(key, []):
+                claim_start_x, claim_end_x, claim_start_y, claim_end_y = self.rectangles[claim_id]
+                if (claim_start_x <= end_x and start_x <= claim_end_x and
+                        claim_start_y <= end_y and start_y <= claim_end_y):
+                    found.add(claim_id)
+
+        return sorted(found)
+
+    def overlaps_any(self, claim_id):
+        start_x, end_x, start_y, end_y = self.rectangles[claim_id]
+        for key in self.bucket_keys(start_x, end_x, start_y, end_y):
+            for other_id in self.buckets.get(key, []):
+                other_start_x, other_end_x, other_start_y, other_end_y = self.rectangles[other_id]
+                if (not other_id == claim_id and
+                        other_start_x <= end_x and start_x <= other_end_x and
+                        other_start_y <= end_y and start_y <= other_end_y):
+                    return True
+
+        return False
+
+    def save(self, file_name):
+        with open(file_name, 'wb') as index_file:
+            pickle.dump([self.bucket_size, self.buckets, self.rectangles], index_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, file_name):
+        with open(file_name, 'rb') as index_file:
+            bucket_size, buckets, rectangles = pickle.load(index_file)
+
+        index = cls(bucket_size)
+        index.buckets = buckets
+        index.rectangles = rectangles
+        return index
+
+    def __len__(self):
+        return len(self.rectangles)
@@ -0,0 +1,114 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import heapq
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class StabbingTree:
+    # Segment tree over compressed y coordinates. An interval is stored in the O(log n) nodes that exactly cover it,
+    # so the intervals containing a point are the ones stored on the path from its leaf to the root.
+    def __init__(self, size):
+        self.size = size
+        self.nodes = {}
+
+    def canonical_nodes(self, low, high):
+        low += self.size
+        high += self.size + 1
+        while low < high:
+            if low & 1:
+                yield low
+                low += 1
+            if high & 1:
+                high -= 1
+                yield high
+            low >>= 1
+            high >>= 1
+
+    def insert(self, low, high, item):
+        for node in self.canonical_nodes(low, high):
+            self.nodes.setdefault(node, set()).add(item)
+
+    def remove(self, low, high, item):
+        for node in self.canonical_nodes(low, high):
+            self.nodes[node].discard(item)
+
+    def stab(self, point):
+        node = point + self.size
+        while node:
+            yield from self.nodes.get(node, ())
+            node >>= 1
+
+
+class StartTree:
+    # Segment tree counting interval starts per compressed y coordinate. Subtrees without starts are skipped, so
+    # reporting the k starts inside a range costs O((k + 1) log n).
+    def __init__(self, size):
+        self.size = size
+        self.counts = [0] * (2 * size)
+        self.starts = {}
+
+    def update(self, point, change):
+        node = point + self.size
+        while node:
+            self.counts[node] += change
+            node >>= 1
+
+    def insert(self, point, item):
+        self.starts.setdefault(point, set()).add(item)
+        self.update(point, 1)
+
+    def remove(self, point, item):
+        self.starts[point].discard(item)
+        self.update(point, -1)
+
+    def report(self, low, high):
+        stack = [[1, 0, self.size - 1]]
+        while stack:
+            node, node_low, node_high = stack.pop()
+            if not self.counts[node] or node_high < low or node_low > high:
+                continue
+            if node >= self.size:
+                yield from self.starts[node_low]
+            else:
+                middle = (node_low + node_high) // 2
+                stack.append([2 * node, node_low, middle])
+                stack.append([2 * node + 1, middle + 1, node_high])
+
+
+def overlapping_pairs(claims):
+    # Sweep line over x. The active claims (whose x range still reaches the sweep line) are indexed by their y range;
+    # a new claim overlaps exactly the active ones whose y range contains its start_y (stabbing query) or starts
+    # inside its y range. Yields every overlapping pair once, in O((n + k) log n) for k pairs.
+    # Claims are any objects with inclusive start_x, end_x, start_y and end_y.
+    y_values = sorted(set([claim.start_y for claim in claims] + [claim.end_y for claim in claims]))
+    y_rank = {y: rank for rank, y in enumerate(y_values)}
+
+    size = 1
+    while size < len(y_values):
+        size *= 2
+    stabbing_tree = StabbingTree(size)
+    start_tree = StartTree(size)
+
+    active = []
+    order = sorted(range(len(claims)), key=lambda i: claims[i].start_x)
+    for i in order:
+        claim = claims[i]
+        low, high = y_rank[claim.start_y], y_rank[claim.end_y]
+
+        while active and active[0][0] < claim.start_x:
+            j = heapq.heappop(active)[1]
+            expired_low, expired_high = y_rank[claims[j].start_y], y_rank[claims[j].end_y]
+            stabbing_tree.remove(expired_low, expired_high, j)
+            start_tree.remove(expired_low, j)
+
+        for j in stabbing_tree.stab(low):
+            yield claims[j], claim
+        for j in start_tree.report(low + 1, high):
+            yield claims[j], claim
+
+        stabbing_tree.insert(low, high, i)
+        start_tree.insert(low, i)
+        heapq.heappush(active, [claim.end_x, i])
@@ -0,0 +1,53 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import array
+import collections
+import itertools
+import re
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+CLAIM_PATTERN = re.compile(r'^#(\d+) @ (\d+),(\d+): (\d+)x(\d+)[ \t\r]*$', re.MULTILINE)
+CLAIM_FIELDS = 5
+
+ClaimRow = collections.namedtuple("ClaimRow", ["id", "start_x", "end_x", "start_y", "end_y"])
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class ClaimColumns:
+    # Claims stored as one array('q') per field. Indexing or iterating gives ClaimRow tuples with the same
+    # id/start_x/end_x/start_y/end_y attributes as Claim, so every overlap engine accepts the columns as they are.
+    def __init__(self, ids, lefts, tops, widths, heights):
+        self.ids = ids
+        self.lefts = lefts
+        self.tops = tops
+        self.widths = widths
+        self.heights = heights
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        left, top = self.lefts[i], self.tops[i]
+        return ClaimRow(self.ids[i], left, left + self.widths[i] - 1, top, top + self.heights[i] - 1)
+
+    def __iter__(self):
+        for i in range(len(self.ids)):
+            yield self[i]
+
+
+def parse_claims(text):
+    # Whole input in one regex pass, straight into columns: no per-claim dict or object. Every non-empty line must be
+    # a whole claim, otherwise the fields of the following claims would shift into the wrong columns.
+    claims = CLAIM_PATTERN.findall(text)
+    if not len(claims) == sum(1 for line in text.split("\n") if line.strip()):
+        for number, line in enumerate(text.split("\n"), 1):
+            if line.strip() and not CLAIM_PATTERN.fullmatch(line):
+                raise ValueError("malformed claim on line " + str(number) + ": " + repr(line))
+    numbers = array.array('q', map(int, itertools.chain.from_iterable(claims)))
+
+    return ClaimColumns(*[numbers[field::CLAIM_FIELDS] for field in range(CLAIM_FIELDS)])
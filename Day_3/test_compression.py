@@ -0,0 +1,60 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import collections
+import random
+import unittest
+
+from Day_3.compression import compressed_area_at_least
+from Day_3.parser import ClaimRow
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+SAMPLE = [ClaimRow(1, 1, 4, 3, 6), ClaimRow(2, 3, 6, 1, 4), ClaimRow(3, 5, 6, 5, 6)]
+SEED = 2018
+RANDOM_CASES = 200
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def random_claims(generator):
+    claims = []
+    for claim_id in range(generator.randrange(30)):
+        start_x, start_y = generator.randrange(10), generator.randrange(10)
+        claims.append(ClaimRow(claim_id, start_x, start_x + generator.randrange(5), start_y,
+                               start_y + generator.randrange(5)))
+
+    return claims
+
+
+def brute_force_area_at_least(claims, k):
+    counts = collections.Counter((x, y) for claim in claims
+                                 for x in range(claim.start_x, claim.end_x + 1)
+                                 for y in range(claim.start_y, claim.end_y + 1))
+    return sum(1 for count in counts.values() if count >= k)
+
+
+class TestCompressedArea(unittest.TestCase):
+    def test_sample(self):
+        self.assertEqual(compressed_area_at_least(SAMPLE, 2), 4)
+        self.assertEqual(compressed_area_at_least(SAMPLE, 1), 32)
+
+    def test_empty(self):
+        self.assertEqual(compressed_area_at_least([], 2), 0)
+
+    def test_random_claims(self):
+        generator = random.Random(SEED)
+        for i in range(RANDOM_CASES):
+            claims = random_claims(generator)
+            for k in [1, 2, 3]:
+                with self.subTest(claims=claims, k=k):
+                    self.assertEqual(compressed_area_at_least(claims, k), brute_force_area_at_least(claims, k))
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
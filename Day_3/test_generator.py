@@ -0,0 +1,35 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import unittest
+
+from Day_3 import generator
+from Day_3.coverage import coverage, uncontested
+from Day_3.parser import parse_claims
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+# Sparse small scales move most claims, the others move almost none
+CASES = [[0.002, 5], [0.01, 1], [0.1, 3], [1, 2018], [3, 7]]
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class TestGenerator(unittest.TestCase):
+    def test_single_uncontested_claim(self):
+        for scale, seed in CASES:
+            with self.subTest(scale=scale, seed=seed):
+                claims = parse_claims("\n".join(generator.generate(scale, seed)))
+                self.assertEqual(len(uncontested(claims, coverage(claims))), 1)
+
+    def test_deterministic(self):
+        self.assertEqual(list(generator.generate(0.1, 3)), list(generator.generate(0.1, 3)))
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import itertools
+import random
+import unittest
+
+from Day_3.overlap import overlapping_pairs
+from Day_3.parser import ClaimRow
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+SAMPLE = [ClaimRow(1, 1, 4, 3, 6), ClaimRow(2, 3, 6, 1, 4), ClaimRow(3, 5, 6, 5, 6)]
+SEED = 2018
+RANDOM_CASES = 200
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def random_claims(generator):
+    # Small fabric, so that shared edges, nested claims and identical claims are common
+    claims = []
+    for claim_id in range(generator.randrange(30)):
+        start_x, start_y = generator.randrange(10), generator.randrange(10)
+        claims.append(ClaimRow(claim_id, start_x, start_x + generator.randrange(5), start_y,
+                               start_y + generator.randrange(5)))
+
+    return claims
+
+
+def brute_force_pairs(claims):
+    return {frozenset([first.id, second.id]) for first, second in itertools.combinations(claims, 2)
+            if max(first.start_x, second.start_x) <= min(first.end_x, second.end_x)
+            and max(first.start_y, second.start_y) <= min(first.end_y, second.end_y)}
+
+
+class TestOverlappingPairs(unittest.TestCase):
+    def assert_pairs(self, claims):
+        pairs = [frozenset([first.id, second.id]) for first, second in overlapping_pairs(claims)]
+        # Every pair exactly once, never a claim with itself
+        self.assertEqual(len(pairs), len(set(pairs)))
+        self.assertTrue(all(len(pair) == 2 for pair in pairs))
+        self.assertEqual(set(pairs), brute_force_pairs(claims))
+
+    def test_sample(self):
+        self.assertEqual([[first.id, second.id] for first, second in overlapping_pairs(SAMPLE)], [[1, 2]])
+
+    def test_empty(self):
+        self.assertEqual(list(overlapping_pairs([])), [])
+
+    def test_random_claims(self):
+        generator = random.Random(SEED)
+        for i in range(RANDOM_CASES):
+            claims = random_claims(generator)
+            with self.subTest(claims=claims):
+                self.assert_pairs(claims)
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -74,12 +74,13 @@
 import datetime
 import re
 
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
 ACTION_SLEEP = "S"
 ACTION_WAKE_UP = "W"
 SHIFT_LENGTH = 60
@@ -199,7 +200,6 @@ def get_most_asleep_minute(shifts):
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
     runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
 
     # Your code goes here
@@ -84,11 +84,12 @@ import datetime
 import re
 
 from utils.helpers import Runner
-from utils.paths import INPUT_PATH, OUTPUT_PATH
+from utils.paths import solver_paths
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
 ACTION_SLEEP = "S"
 ACTION_WAKE_UP = "W"
 SHIFT_LENGTH = 60
@@ -213,7 +214,6 @@ def get_most_asleep(shifts):
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
     runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
 
     # Your code goes here
@@ -0,0 +1,62 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import datetime
+import math
+import random
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+BASE_SHIFTS = 250
+BASE_GUARDS = 20
+MAX_NAPS = 3
+SHUFFLE_BLOCK = 100000
+START_DATE = datetime.date(1518, 1, 1)
+SHIFT_LENGTH = 60
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def record(date, hour, minute, text):
+    return "[{} {:02d}:{:02d}] {}".format(date.isoformat(), hour, minute, text)
+
+
+def shift_records(generator, date, guard_id):
+    if generator.random() < 0.5:
+        records = [record(date - datetime.timedelta(days=1), 23, generator.randint(45, 59),
+                          "Guard #{} begins shift".format(guard_id))]
+    else:
+        records = [record(date, 0, generator.randint(0, 5), "Guard #{} begins shift".format(guard_id))]
+
+    minutes = sorted(generator.sample(range(6, SHIFT_LENGTH), 2 * generator.randint(0, MAX_NAPS)))
+    for i in range(0, len(minutes), 2):
+        records.append(record(date, 0, minutes[i], "falls asleep"))
+        records.append(record(date, 0, minutes[i + 1], "wakes up"))
+
+    return records
+
+
+def generate(scale=1, seed=DEFAULT_SEED):
+    # One shift per day, so the date range grows with the scale. Records are shuffled in blocks to mimic the
+    # unsorted puzzle input without holding the whole log in memory.
+    generator = random.Random(seed)
+    shifts_number = max(int(BASE_SHIFTS * scale), 1)
+    guard_ids = generator.sample(range(10, 10000), int(BASE_GUARDS * math.sqrt(max(scale, 1))))
+
+    if shifts_number > (datetime.date.max - START_DATE).days:
+        raise ValueError("Scale " + str(scale) + " needs more days than the calendar holds.")
+
+    block = []
+    for day in range(shifts_number):
+        date = START_DATE + datetime.timedelta(days=day + 1)
+        block += shift_records(generator, date, generator.choice(guard_ids))
+        if len(block) >= SHUFFLE_BLOCK:
+            generator.shuffle(block)
+            yield from block
+            block = []
+
+    generator.shuffle(block)
+    yield from block
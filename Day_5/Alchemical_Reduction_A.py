@@ -30,40 +30,38 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from Day_5.polymer import react, react_parallel, react_stream
+from utils import File
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
+# Worker processes reacting chunks of the polymer; 1 streams the input file through a single reactor instead
+WORKERS = 1
 
 
 #######################################################################################################################
 # Root function
 #######################################################################################################################
-def shrink(record):
-    old_value = ""
-    new_value = record
-
-    while not len(new_value) == len(old_value):
-        old_value = new_value
-
-        for i in "abcdefghijklmnopqrstuvwxyz":
-            new_value = new_value.replace(i + i.upper(), "")
-            new_value = new_value.replace(i.upper() + i, "")
-
-    return new_value
+def shrink(record, workers=1):
+    if workers == 1:
+        return react(record).decode("ascii")
+    return react_parallel(record, workers=workers).decode("ascii")
 
 
 #######################################################################################################################
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
-    runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
-
-    # Your code goes here
-    shrunk_result = shrink(runner.input_data[0])
+    if WORKERS == 1:
+        runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True, input_mode=File.MODE_BLOCKS)
+        shrunk_result = react_stream(runner.input_data)
+    else:
+        runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
+        shrunk_result = shrink(runner.input_data[0], WORKERS)
 
     runner.finish([len(shrunk_result)])
 
@@ -48,42 +48,48 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+import concurrent.futures
+
+from Day_5.polymer import react, reacted_length
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
 
 
 #######################################################################################################################
 # Root function
 #######################################################################################################################
-def shrink(record):
-    old_value = ""
-    new_value = record
+def print_progress(current, end):
+    print(str(current) + "/" + str(end) + " finished")
 
-    while not len(new_value) == len(old_value):
-        old_value = new_value
 
-        for i in "abcdefghijklmnopqrstuvwxyz":
-            new_value = new_value.replace(i + i.upper(), "").replace(i.upper() + i, "")
+def candidate_lengths(reacted, elements, workers):
+    if workers == 1:
+        for element in elements:
+            yield reacted_length(reacted, element)
+        return
 
-    return new_value
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(reacted_length, reacted, element) for element in elements]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
 
 
-def improved_shrink(record):
-    elements = set(record.lower())
+def improved_shrink(record, progress=None, workers=None):
+    # Removing a unit type commutes with reacting, so every candidate starts from the already reacted polymer
+    reacted = react(record)
+    elements = sorted(set(record.lower()))
     results = []
 
-    current = 0
     end = len(elements)
-    for element in elements:
-        updated_record = record.replace(element, "").replace(element.upper(), "")
-        results.append(len(shrink(updated_record)))
-
-        current += 1
-        print(str(current) + "/" + str(end) + " finished")
+    for length in candidate_lengths(reacted, elements, workers):
+        results.append(length)
+        if progress:
+            progress(len(results), end)
 
     return min(results)
 
@@ -92,11 +98,10 @@ def improved_shrink(record):
 # Main function
 #######################################################################################################################
 def __main__():
-    # BE SURE TO RENAME PARENT_FOLDER_NAME VARIABLE
     runner = Runner(INPUT_PATH, OUTPUT_PATH, debug=True)
 
     # Your code goes here
-    shrunk_len = improved_shrink(runner.input_data[0])
+    shrunk_len = improved_shrink(runner.input_data[0], progress=print_progress)
 
     runner.finish([shrunk_len])
 
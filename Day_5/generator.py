@@ -0,0 +1,36 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+import string
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+BASE_UNITS = 50000
+REACTION_CHANCE = 0.45
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def generate(scale=1, seed=DEFAULT_SEED):
+    # Units are added as a random walk: either a unit that does not react with the last unreacted one, or the
+    # opposite polarity of that unit, which will react with it. The polymer thus nests reactions like the real input.
+    generator = random.Random(seed)
+    units_number = max(int(BASE_UNITS * scale), 1)
+
+    units = []
+    unreacted = []
+    for i in range(units_number):
+        if unreacted and generator.random() < REACTION_CHANCE:
+            units.append(unreacted.pop().swapcase())
+        else:
+            unit = generator.choice(string.ascii_letters)
+            while unreacted and unit == unreacted[-1].swapcase():
+                unit = generator.choice(string.ascii_letters)
+            unreacted.append(unit)
+            units.append(unit)
+
+    yield "".join(units)
@@ -0,0 +1,167 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import concurrent.futures
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+# Lower and upper case codes of the same letter differ only in this bit, so two units react when their XOR equals it
+POLARITY = ord("a") ^ ord("A")
+LETTER_MASK = POLARITY - 1
+WHITESPACE = b" \t\r\n"
+# Vectorized sweeps stop once a sweep removes less than this share of the polymer; the stack reactor finishes it
+STALL_RATIO = 0.01
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+class Reactor:
+    def __init__(self):
+        # Stack of the units that did not react so far: always an irreducible polymer
+        self.units = bytearray()
+
+    def feed(self, polymer):
+        units = self.units
+        append = units.append
+        pop = units.pop
+        top = units[-1] if units else 0
+
+        for unit in polymer:
+            if unit ^ top == POLARITY:
+                pop()
+                top = units[-1] if units else 0
+            else:
+                append(unit)
+                top = unit
+
+        return self
+
+    def __len__(self):
+        return len(self.units)
+
+
+def encode(polymer):
+    if isinstance(polymer, str):
+        return polymer.encode("ascii")
+    return polymer
+
+
+def remove_unit(polymer, unit):
+    unit = encode(unit)
+    return bytes(polymer).translate(None, unit.lower() + unit.upper())
+
+
+def react(polymer, removed_unit=None):
+    # Single pass over the polymer: linear time, one byte of memory per unit left
+    polymer = encode(polymer)
+    if removed_unit:
+        polymer = remove_unit(polymer, removed_unit)
+
+    return bytes(Reactor().feed(polymer).units)
+
+
+def react_stream(blocks, removed_unit=None):
+    # Reacts a polymer given as an iterable of byte blocks (e.g. utils.File.read_blocks): only the irreducible prefix
+    # is kept in memory and reacting starts with the first block
+    removed_units = WHITESPACE
+    if removed_unit:
+        removed_units += encode(removed_unit).lower() + encode(removed_unit).upper()
+
+    reactor = Reactor()
+    for block in blocks:
+        reactor.feed(bytes(block).translate(None, removed_units))
+
+    return bytes(reactor.units)
+
+
+def merge(units, polymer):
+    # Joins two irreducible polymers: only units at the seam can still react, cancelling pairwise outwards from it.
+    # units (a bytearray) is extended in place.
+    seam = 0
+    limit = min(len(units), len(polymer))
+    while seam < limit and units[-1 - seam] ^ polymer[seam] == POLARITY:
+        seam += 1
+
+    del units[len(units) - seam:]
+    units += memoryview(polymer)[seam:]
+    return units
+
+
+def react_parallel(polymer, removed_unit=None, workers=None, chunks=None):
+    # Reacting is associative: chunks are reacted in worker processes and merged in order at their seams
+    polymer = encode(polymer)
+    if removed_unit:
+        polymer = remove_unit(polymer, removed_unit)
+
+    workers = workers or os.cpu_count()
+    chunks = max(min(chunks or workers, len(polymer)), 1)
+    chunk_size = max(-(-len(polymer) // chunks), 1)
+    parts = [polymer[i:i + chunk_size] for i in range(0, len(polymer), chunk_size)]
+
+    units = bytearray()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(react, parts):
+            merge(units, part)
+
+    return bytes(units)
+
+
+def reacted_length(polymer, removed_unit=None):
+    return len(react(polymer, removed_unit))
+
+
+def to_charges(polymer):
+    # Units as int8 charges: the letter number (1-26), positive for lower case and negative for upper case, so two
+    # units react exactly when their charges add up to zero
+    codes = numpy.frombuffer(polymer, dtype=numpy.uint8)
+    letters = (codes & LETTER_MASK).astype(numpy.int8)
+    return numpy.where(codes & POLARITY, letters, -letters)
+
+
+def from_charges(charges):
+    codes = numpy.where(charges > 0, charges + (ord("a") - 1), (ord("A") - 1) - charges)
+    return codes.astype(numpy.uint8).tobytes()
+
+
+def sweep(charges):
+    # Removes every reacting pair that does not overlap another one. In a run like "aAaA" every other pair is taken,
+    # starting with the first one of the run.
+    positions = numpy.flatnonzero(charges[:-1] + charges[1:] == 0)
+    if not len(positions):
+        return charges
+
+    run_starts = numpy.concatenate(([True], numpy.diff(positions) > 1))
+    run_start_positions = positions[run_starts][numpy.cumsum(run_starts) - 1]
+    pairs = positions[(positions - run_start_positions) % 2 == 0]
+
+    keep = numpy.ones(len(charges), dtype=bool)
+    keep[pairs] = False
+    keep[pairs + 1] = False
+    return charges[keep]
+
+
+def react_vectorized(polymer, removed_unit=None):
+    # Same result as react(), computed with NumPy sweeps; falls back to react() when NumPy is not installed
+    if numpy is None:
+        return react(polymer, removed_unit)
+
+    polymer = encode(polymer)
+    if removed_unit:
+        polymer = remove_unit(polymer, removed_unit)
+
+    charges = to_charges(polymer)
+    while len(charges):
+        length = len(charges)
+        charges = sweep(charges)
+        if length - len(charges) < STALL_RATIO * length:
+            break
+
+    return react(from_charges(charges))
@@ -0,0 +1,99 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+import string
+import unittest
+
+from Day_5 import polymer
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+SAMPLE = "dabAcCaCBAcCcaDA"
+SAMPLE_REACTED = "dabCBAcaDA"
+SEED = 2018
+RANDOM_POLYMERS = 200
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def replace_shrink(record):
+    # The original str.replace solver, kept as the reference every engine is checked against
+    old_value = ""
+    new_value = record
+
+    while not len(new_value) == len(old_value):
+        old_value = new_value
+
+        for i in string.ascii_lowercase:
+            new_value = new_value.replace(i + i.upper(), "").replace(i.upper() + i, "")
+
+    return new_value
+
+
+def random_polymers():
+    # Few letter types, so that long reaction chains and nested reactions are common
+    generator = random.Random(SEED)
+    for i in range(RANDOM_POLYMERS):
+        letters = "abcABC"[:generator.choice([2, 4, 6])]
+        yield "".join(generator.choice(letters) for j in range(generator.randrange(200)))
+
+
+class TestPolymer(unittest.TestCase):
+    def assert_engines(self, record, removed_unit=None):
+        expected = record
+        if removed_unit:
+            expected = expected.replace(removed_unit, "").replace(removed_unit.upper(), "")
+        expected = replace_shrink(expected).encode("ascii")
+
+        self.assertEqual(polymer.react(record, removed_unit), expected)
+        self.assertEqual(polymer.react_vectorized(record, removed_unit), expected)
+        blocks = [record[i:i + 7].encode("ascii") for i in range(0, len(record), 7)]
+        self.assertEqual(polymer.react_stream(blocks, removed_unit), expected)
+
+    def test_sample(self):
+        self.assertEqual(polymer.react(SAMPLE), SAMPLE_REACTED.encode("ascii"))
+        self.assert_engines(SAMPLE)
+        for removed_unit in "abcd":
+            self.assert_engines(SAMPLE, removed_unit)
+
+    def test_random_polymers(self):
+        for record in random_polymers():
+            with self.subTest(record=record):
+                self.assert_engines(record)
+                self.assert_engines(record, "a")
+
+    def test_vectorized_without_numpy(self):
+        numpy = polymer.numpy
+        polymer.numpy = None
+        try:
+            for record in random_polymers():
+                self.assertEqual(polymer.react_vectorized(record), replace_shrink(record).encode("ascii"))
+        finally:
+            polymer.numpy = numpy
+
+    def test_merge_matches_react(self):
+        # react_parallel only merges reacted chunks in order, which is checked here without worker processes
+        for record in random_polymers():
+            for chunks in [1, 2, 5]:
+                chunk_size = max(-(-len(record) // chunks), 1)
+                units = bytearray()
+                for i in range(0, len(record), chunk_size):
+                    polymer.merge(units, polymer.react(record[i:i + chunk_size]))
+                self.assertEqual(bytes(units), replace_shrink(record).encode("ascii"))
+
+    def test_parallel(self):
+        records = list(random_polymers())[:5] + [SAMPLE]
+        for record in records:
+            expected = replace_shrink(record).encode("ascii")
+            self.assertEqual(polymer.react_parallel(record, workers=2, chunks=3), expected)
+        self.assertEqual(polymer.react_parallel(""), b"")
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -64,12 +64,13 @@
 #######################################################################################################################
 # IMPORTS
 #######################################################################################################################
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
 
 
 #######################################################################################################################
@@ -105,7 +106,10 @@ def create_coords(data):
     id_list += id_list.upper()
     for record in data:
         x, y = record.split(", ")
-        coords.append(Point(id_list[point_id], int(x), int(y)))
+        if point_id < len(id_list):
+            coords.append(Point(id_list[point_id], int(x), int(y)))
+        else:
+            coords.append(Point(str(point_id), int(x), int(y)))
         point_id += 1
 
     return coords
@@ -116,7 +120,7 @@ def get_boundaries(coords):
     for point in coords:
         if point.x > max_x:
             max_x = point.x
-        if point.x > max_y:
+        if point.y > max_y:
             max_y = point.y
 
     return [max_x + 1, max_y + 1]
@@ -168,7 +172,7 @@ def map_coords(coords, max_x, max_y):
 
 def get_closest_point(coords, x, y):
     closest_point_id = ""
-    closest_point_distance = 9999
+    closest_point_distance = float("inf")
     distance_equal = False
 
     current_point = Point(-1, x, y)
@@ -0,0 +1,31 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import math
+import random
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+BASE_COORDS = 50
+BASE_MARGIN = 40
+BASE_GRID = 360
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def generate(scale=1, seed=DEFAULT_SEED):
+    # The grid grows with the square root of the scale to keep the coordinate density of the real input
+    generator = random.Random(seed)
+    coords_number = max(int(BASE_COORDS * scale), 1)
+    stretch = math.sqrt(max(scale, 1))
+    low, high = int(BASE_MARGIN * stretch), int(BASE_GRID * stretch)
+
+    coords = set([])
+    while len(coords) < coords_number:
+        coord = (generator.randint(low, high), generator.randint(low, high))
+        if coord not in coords:
+            coords.add(coord)
+            yield "{}, {}".format(*coord)
@@ -59,12 +59,13 @@
 #######################################################################################################################
 import re
 
-from utils.paths import SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH
+from utils.paths import solver_paths
 from utils.helpers import Runner
 
 #######################################################################################################################
 # CONSTANTS
 #######################################################################################################################
+SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH = solver_paths(__file__)
 
 
 #######################################################################################################################
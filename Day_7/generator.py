@@ -0,0 +1,34 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+import string
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+BASE_INSTRUCTIONS = 100
+MAX_INSTRUCTIONS = len(string.ascii_uppercase) * (len(string.ascii_uppercase) - 1) // 2
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def generate(scale=1, seed=DEFAULT_SEED):
+    # Steps are single letters, so the graph can only grow denser: the scale is capped at the complete DAG over A-Z.
+    # A chain through a random order keeps every step connected and the graph acyclic.
+    generator = random.Random(seed)
+    order = list(string.ascii_uppercase)
+    generator.shuffle(order)
+
+    instructions = set((order[i], order[i + 1]) for i in range(len(order) - 1))
+    instructions_number = min(max(int(BASE_INSTRUCTIONS * scale), len(instructions)), MAX_INSTRUCTIONS)
+    while len(instructions) < instructions_number:
+        before, after = sorted(generator.sample(range(len(order)), 2))
+        instructions.add((order[before], order[after]))
+
+    instructions = sorted(instructions)
+    generator.shuffle(instructions)
+    for before, after in instructions:
+        yield "Step {} must be finished before step {} can begin.".format(before, after)
@@ -0,0 +1,52 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import random
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_SEED = 2018
+BASE_NODES = 2000
+DEFAULT_DEPTH = 8
+MAX_CHILDREN = 3
+MIN_METADATA = 1
+MAX_METADATA = 11
+MAX_METADATA_VALUE = 9
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def generate(scale=1, seed=DEFAULT_SEED, max_depth=DEFAULT_DEPTH):
+    # Built with an explicit stack, so depth is only limited by max_depth. The root keeps taking children until the
+    # node budget is spent, then its children count is patched into the header.
+    generator = random.Random(seed)
+    nodes_budget = max(int(BASE_NODES * scale), 1) - 1
+
+    tokens = [0, generator.randint(MIN_METADATA, MAX_METADATA)]
+    root_children = 0
+    # Each entry: [children left to create, metadata length]
+    stack = [[0, tokens[1]]]
+
+    while stack:
+        if len(stack) == 1 and stack[0][0] == 0 and nodes_budget > 0:
+            stack[0][0] = 1
+            root_children += 1
+
+        node = stack[-1]
+        if node[0] > 0:
+            node[0] -= 1
+            nodes_budget -= 1
+            children = 0
+            if len(stack) < max_depth:
+                children = max(min(generator.randint(0, MAX_CHILDREN), nodes_budget), 0)
+            metadata_length = generator.randint(MIN_METADATA, MAX_METADATA)
+            tokens += [children, metadata_length]
+            stack.append([children, metadata_length])
+        else:
+            stack.pop()
+            tokens += [generator.randint(1, MAX_METADATA_VALUE) for i in range(node[1])]
+
+    tokens[0] = root_children
+    yield " ".join(str(token) for token in tokens)
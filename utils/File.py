@@ -1,24 +1,93 @@
 import codecs
+import itertools
+import locale
+import mmap
+import os
+
+MODE_LIST = "list"
+MODE_STREAM = "stream"
+MODE_MMAP = "mmap"
+MODE_BLOCKS = "blocks"
+
+READ_BLOCK_SIZE = 1048576
+
+WRITE_CHUNK_SIZE = 65536
 
 
 def read(file_name, encoding=None):
-    if encoding:
-        input_file = codecs.open(file_name, 'r', encoding)
-    else:
-        input_file = open(file_name, 'r')
-
-    data = []
-    for input_line in input_file:
-        data.append(input_line.replace("\n", ""))
-    return data
-
-
-def write(file_name, lines, encoding=None):
-    if encoding:
-        file = codecs.open(file_name, 'w', encoding)
-    else:
-        file = open(file_name, 'w')
-
-    for line in lines:
-        file.write(str(line) + "\n")
-    file.close()
+    return list(read_lines(file_name, encoding))
+
+
+def read_lines(file_name, encoding=None):
+    # Lazy variant of read(): yields one stripped line at a time, so memory stays constant regardless of file size.
+    with open(file_name, 'r', encoding=encoding) as input_file:
+        for input_line in input_file:
+            yield input_line.replace("\n", "")
+
+
+def read_mmap(file_name):
+    # Zero-copy variant of read(): yields memoryview slices over a read-only mapping of the file. The mapping is
+    # released once the last slice is garbage collected, so slices may be kept after the iteration is over.
+    with open(file_name, 'rb') as input_file:
+        if os.fstat(input_file.fileno()).st_size == 0:
+            return
+        buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(buffer)
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        line_end = end
+        if line_end > start and view[line_end - 1] == ord("\r"):
+            line_end -= 1
+        yield view[start:line_end]
+        start = end + 1
+
+
+def read_blocks(file_name, block_size=READ_BLOCK_SIZE):
+    # Raw bytes in fixed-size blocks, regardless of line boundaries
+    with open(file_name, 'rb') as input_file:
+        block = input_file.read(block_size)
+        while block:
+            yield block
+            block = input_file.read(block_size)
+
+
+READERS = {
+    MODE_LIST: read,
+    MODE_STREAM: read_lines,
+    MODE_MMAP: read_mmap,
+    MODE_BLOCKS: read_blocks,
+}
+
+
+def write(file_name, lines, encoding=None, chunk_size=WRITE_CHUNK_SIZE):
+    # Same bytes as writing line by line: text mode ends lines with os.linesep, codecs.open with an encoding did not
+    newline = "\n" if encoding else os.linesep
+    encoder = codecs.getincrementalencoder(encoding or locale.getpreferredencoding(False))()
+    chunks = (encoder.encode(newline.join(map(str, chunk)) + newline) for chunk in _chunks(lines, chunk_size))
+    _write_chunks(file_name, chunks)
+
+
+def write_bytes(file_name, lines, chunk_size=WRITE_CHUNK_SIZE):
+    # Byte-level variant of write(): lines are bytes-like objects (bytes, bytearray, memoryview) written as they are.
+    chunks = (b"\n".join(chunk) + b"\n" for chunk in _chunks(lines, chunk_size))
+    _write_chunks(file_name, chunks)
+
+
+def _chunks(lines, chunk_size):
+    # Splits any iterable into lists of at most chunk_size items without materializing the whole iterable.
+    iterator = iter(lines)
+    chunk = list(itertools.islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+
+def _write_chunks(file_name, chunks):
+    with open(file_name, 'wb') as file:
+        for chunk in chunks:
+            file.write(chunk)
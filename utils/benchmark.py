@@ -0,0 +1,182 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from utils import File, generators, paths, solvers
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+BASELINE_PATH = os.path.join(paths.PROJECT_PATH, "benchmark_baseline.json")
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+DEFAULT_THRESHOLD = 0.1
+INPUT_LABEL = "input"
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def measure(module_name, solver_input_path, repeat, warmup, work_dir):
+    output_path = os.path.join(work_dir, module_name + paths.OUTPUT_SUFFIX)
+    timings = []
+
+    for i in range(warmup + repeat):
+        time_start = time.perf_counter()
+        solvers.run(module_name, solver_input_path, output_path)
+        if i >= warmup:
+            timings.append(time.perf_counter() - time_start)
+
+    return summarize(timings)
+
+
+def scaled_input(scale):
+    return lambda module_name: generators.generated_input_path(solvers.day_number(module_name), scale)
+
+
+def summarize(timings):
+    return {
+        "runs": len(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "min": min(timings),
+        "max": max(timings),
+    }
+
+
+def benchmark(module_names, inputs, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP):
+    # inputs maps a label to a function that returns the input path for a solver module
+    results = {}
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for module_name in module_names:
+            results[module_name] = {}
+            for label, resolve_input in inputs.items():
+                results[module_name][label] = measure(module_name, resolve_input(module_name), repeat, warmup,
+                                                      work_dir)
+
+    return results
+
+
+def check(module_names):
+    # Solvers whose answer on io/input.txt differs from the stored io/*_output.txt
+    mismatches = []
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for module_name in module_names:
+            output_path = os.path.join(work_dir, module_name + paths.OUTPUT_SUFFIX)
+            output = solvers.run(module_name, solvers.input_path(module_name), output_path)
+            expected = File.read(solvers.expected_output_path(module_name))
+            if not output == expected:
+                mismatches.append([module_name, expected, output])
+
+    return mismatches
+
+
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    # Medians are compared, being far less sensitive to a single noisy run than the mean
+    regressions = []
+
+    for module_name, labels in results.items():
+        for label, result in labels.items():
+            reference = baseline.get(module_name, {}).get(label)
+            if reference and result["median"] > reference["median"] * (1 + threshold):
+                regressions.append([module_name, label, reference["median"], result["median"]])
+
+    return regressions
+
+
+def load_baseline(baseline_path):
+    if not os.path.exists(baseline_path):
+        return {}
+
+    with open(baseline_path, 'r') as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(baseline_path, results):
+    baseline = load_baseline(baseline_path)
+    for module_name, labels in results.items():
+        baseline.setdefault(module_name, {}).update(labels)
+
+    with open(baseline_path, 'w') as baseline_file:
+        json.dump(baseline, baseline_file, indent=4, sort_keys=True)
+
+
+def report(results):
+    lines = [" ".join(["{:<45}".format("solver"), "{:<10}".format("input"), "{:>10}".format("mean"),
+                       "{:>10}".format("median"), "{:>10}".format("stdev"), "{:>10}".format("min")])]
+
+    for module_name, labels in results.items():
+        for label, result in labels.items():
+            lines.append(" ".join(["{:<45}".format(module_name), "{:<10}".format(label),
+                                   "{:>10.4f}".format(result["mean"]), "{:>10.4f}".format(result["median"]),
+                                   "{:>10.4f}".format(result["stdev"]), "{:>10.4f}".format(result["min"])]))
+
+    return lines
+
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark every Day_N solver.")
+    parser.add_argument("--day", type=int, action="append", help="only benchmark this day (repeatable)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="measured runs per solver and input")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="discarded runs before measuring")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed median slowdown against the baseline, as a fraction")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--scale", type=float, action="append", default=[],
+                        help="also benchmark a generated input of this size relative to the real one (repeatable)")
+    parser.add_argument("--check", action="store_true", help="verify the answers before benchmarking")
+
+    return parser.parse_args(arguments)
+
+
+#######################################################################################################################
+# Main function
+#######################################################################################################################
+def __main__():
+    arguments = parse_arguments(sys.argv[1:])
+    module_names = solvers.discover(arguments.day)
+
+    if arguments.check:
+        mismatches = check(module_names)
+        for module_name, expected, output in mismatches:
+            print("MISMATCH", module_name + ":", "expected", expected, "got", output)
+        if mismatches:
+            sys.exit(1)
+
+    inputs = {INPUT_LABEL: solvers.input_path}
+    for scale in arguments.scale:
+        scale = generators.format_scale(scale)
+        inputs["x" + str(scale)] = scaled_input(scale)
+    results = benchmark(module_names, inputs, arguments.repeat, arguments.warmup)
+
+    for line in report(results):
+        print(line)
+
+    if arguments.save:
+        save_baseline(arguments.baseline, results)
+        return
+
+    regressions = find_regressions(results, load_baseline(arguments.baseline), arguments.threshold)
+    for module_name, label, reference, median in regressions:
+        print("REGRESSION", module_name, label + ":", reference, "->", median, "seconds (median).")
+
+    if regressions:
+        sys.exit(1)
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    __main__()
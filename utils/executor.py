@@ -0,0 +1,150 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import argparse
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+
+from utils import solvers
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+DEFAULT_TIMEOUT = 300
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_TIMEOUT = "timeout"
+PARTIAL_SUFFIX = "_partial.txt"
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def partial_output_path(module_name):
+    return solvers.expected_output_path(module_name)[:-4] + PARTIAL_SUFFIX
+
+
+def execute(module_name, connection):
+    # Runs in its own process. The answer is written to a partial file first and replaces the stored output only once
+    # it is complete, so a solver stopped halfway never leaves a truncated io/*_output.txt behind.
+    time_start = time.perf_counter()
+    try:
+        output = solvers.run(module_name, solvers.input_path(module_name), partial_output_path(module_name))
+        os.replace(partial_output_path(module_name), solvers.expected_output_path(module_name))
+        connection.send([STATUS_OK, time.perf_counter() - time_start, output])
+    except Exception as error:
+        discard_partial_output(module_name)
+        connection.send([STATUS_FAILED, None, [repr(error)]])
+    finally:
+        connection.close()
+
+
+def start(module_name, timeout):
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=execute, args=(module_name, sender))
+    process.start()
+    sender.close()
+
+    return [process, receiver, time.perf_counter() + timeout]
+
+
+def discard_partial_output(module_name):
+    if os.path.exists(partial_output_path(module_name)):
+        os.remove(partial_output_path(module_name))
+
+
+def stop(module_name, process):
+    process.terminate()
+    process.join()
+    discard_partial_output(module_name)
+
+
+def execute_all(module_names, workers=None, timeout=DEFAULT_TIMEOUT):
+    # Every solver gets a process of its own, started as soon as fewer than `workers` are running, and is terminated
+    # once it has run for `timeout` seconds. By default all solvers start right away.
+    workers = workers or max(len(module_names), 1)
+    pending = list(module_names)
+    running = {}
+    results = {}
+
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                module_name = pending.pop(0)
+                running[module_name] = start(module_name, timeout)
+
+            next_deadline = min(deadline for process, receiver, deadline in running.values())
+            ready = multiprocessing.connection.wait([receiver for process, receiver, deadline in running.values()],
+                                                    timeout=max(next_deadline - time.perf_counter(), 0))
+
+            for module_name, [process, receiver, deadline] in list(running.items()):
+                if receiver in ready:
+                    # Received before joining: a worker blocks until the pipe is read
+                    try:
+                        results[module_name] = receiver.recv()
+                    except EOFError:
+                        results[module_name] = None
+                    process.join()
+                    if results[module_name] is None:
+                        # The worker died without reporting, e.g. killed from outside
+                        discard_partial_output(module_name)
+                        results[module_name] = [STATUS_FAILED, None, ["exit code " + str(process.exitcode)]]
+                elif time.perf_counter() >= deadline:
+                    stop(module_name, process)
+                    results[module_name] = [STATUS_TIMEOUT, timeout, []]
+                else:
+                    continue
+                receiver.close()
+                del running[module_name]
+    finally:
+        # Only left over when interrupted
+        for module_name, [process, receiver, deadline] in running.items():
+            stop(module_name, process)
+
+    return {module_name: results[module_name] for module_name in module_names if module_name in results}
+
+
+def report(results):
+    lines = []
+    for module_name, [status, duration, output] in results.items():
+        duration = "-" if duration is None else "{:.4f}".format(duration)
+        lines.append(" ".join(["{:<45}".format(module_name), "{:<8}".format(status), "{:>10}".format(duration),
+                               " ".join(str(line) for line in output)]))
+
+    return lines
+
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Run every Day_N solver in parallel and write its output file.")
+    parser.add_argument("--day", type=int, action="append", help="only run this day (repeatable)")
+    parser.add_argument("--workers", type=int, help="worker processes, one per solver by default")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds each solver may run")
+
+    return parser.parse_args(arguments)
+
+
+#######################################################################################################################
+# Main function
+#######################################################################################################################
+def __main__():
+    arguments = parse_arguments(sys.argv[1:])
+
+    time_start = time.perf_counter()
+    results = execute_all(solvers.discover(arguments.day), arguments.workers, arguments.timeout)
+
+    for line in report(results):
+        print(line)
+    print("Program ran for: ", time.perf_counter() - time_start, "seconds.")
+
+    if any(not result[0] == STATUS_OK for result in results.values()):
+        sys.exit(1)
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    __main__()
@@ -0,0 +1,78 @@
+#######################################################################################################################
+# IMPORTS
+#######################################################################################################################
+import argparse
+import importlib
+import os
+import sys
+
+from utils import File, paths, solvers
+
+#######################################################################################################################
+# CONSTANTS
+#######################################################################################################################
+GENERATOR_MODULE = "generator"
+GENERATED_FOLDER = "generated"
+PARTIAL_SUFFIX = ".partial"
+DEFAULT_SEED = 2018
+
+
+#######################################################################################################################
+# Root function
+#######################################################################################################################
+def load(day):
+    return importlib.import_module(paths.DAY_PREFIX + str(day) + "." + GENERATOR_MODULE)
+
+
+def generated_input_path(day, scale, seed=DEFAULT_SEED):
+    # Generated inputs are cached on disk, so repeated benchmark runs measure the solver and not the generator
+    file_name = "input_x" + str(scale) + "_seed" + str(seed) + ".txt"
+    path = os.path.join(paths.day_path(day), paths.FILES_NAME, GENERATED_FOLDER, file_name)
+
+    if not os.path.exists(path):
+        # Written aside and moved into place once complete: a failed or interrupted generator leaves no cached input
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial_path = path + PARTIAL_SUFFIX
+        try:
+            File.write(partial_path, load(day).generate(scale, seed))
+            os.replace(partial_path, path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    return path
+
+
+def format_scale(scale):
+    if scale == int(scale):
+        return int(scale)
+    return scale
+
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Generate large synthetic Day_N inputs.")
+    parser.add_argument("--day", type=int, action="append", help="only generate this day (repeatable)")
+    parser.add_argument("--scale", type=float, action="append", required=True,
+                        help="size relative to the real input (repeatable)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+
+    return parser.parse_args(arguments)
+
+
+#######################################################################################################################
+# Main function
+#######################################################################################################################
+def __main__():
+    arguments = parse_arguments(sys.argv[1:])
+    days = sorted(set(solvers.day_number(module_name) for module_name in solvers.discover(arguments.day)))
+
+    for day in days:
+        for scale in arguments.scale:
+            print(generated_input_path(day, format_scale(scale), arguments.seed))
+
+
+#######################################################################################################################
+# Process
+#######################################################################################################################
+if __name__ == "__main__":
+    __main__()
@@ -1,33 +1,129 @@
 #######################################################################################################################
 # Prepare libs
 #######################################################################################################################
+import contextlib
+import cProfile
+import io
+import json
+import pstats
+import sys
 import time
+import tracemalloc
 from utils import File
 
+ARG_PROFILE = "--profile"
+ARG_TRACE_MEMORY = "--trace-memory"
+ARG_STATS = "--stats"
+
+PHASE_READ = "read"
+PHASE_SOLVE = "solve"
+PHASE_WRITE = "write"
+
+PROFILE_SUFFIX = ".prof"
+STATS_SUFFIX = "_stats.json"
+PROFILE_TOP_ENTRIES = 20
+
 
 class Runner:
-    def __init__(self, input_file, output_file, debug=False):
+    def __init__(self, input_file, output_file, debug=False, input_mode=File.MODE_LIST, profile=None,
+                 trace_memory=None, write_stats=None):
         self.time_start = time.time()
         self.time_finish = None
         self.time_execution = None
 
+        # Profiling switches default to the command line flags, so any Day_N script can be profiled as it is
+        self.profile = ARG_PROFILE in sys.argv if profile is None else profile
+        self.trace_memory = ARG_TRACE_MEMORY in sys.argv if trace_memory is None else trace_memory
+        self.write_stats = ARG_STATS in sys.argv if write_stats is None else write_stats
+
+        self.phases = {}
+        self.memory_peak = None
+        self.profiler = None
+
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
         self.input_file = input_file
         self.output_file = output_file
-        self.input_data = File.read(input_file)
+        self.input_mode = input_mode
+        self.time_phases = time.perf_counter()
+        with self.phase(PHASE_READ):
+            self.input_data = File.READERS[input_mode](input_file)
+        # Lazy modes only open the file here: the reading happens while the script pulls from the iterator
+        if not input_mode == File.MODE_LIST:
+            self.input_data = self.timed(PHASE_READ, self.input_data)
         self.output_data = []
 
         self.debug = debug
 
+    @contextlib.contextmanager
+    def phase(self, name):
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + time.perf_counter() - phase_start
+
+    def timed(self, name, iterable):
+        # Time spent producing every item counts towards the phase, time spent by the consumer does not
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
     def finish(self, output_data):
         self.output_data = output_data
-        File.write(self.output_file, self.output_data)
+        # Unless the script times it itself, solve is whatever time no phase covered before writing
+        if PHASE_SOLVE not in self.phases:
+            covered = sum(self.phases.values())
+            self.phases[PHASE_SOLVE] = max(time.perf_counter() - self.time_phases - covered, 0)
+        with self.phase(PHASE_WRITE):
+            File.write(self.output_file, self.output_data)
 
         self.time_finish = time.time()
         self.time_execution = self.time_finish - self.time_start
 
+        if self.profiler:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.output_file[:-4] + PROFILE_SUFFIX)
+        if self.trace_memory:
+            self.memory_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if self.write_stats:
+            with open(self.output_file[:-4] + STATS_SUFFIX, 'w') as stats_file:
+                json.dump(self.stats(), stats_file, indent=4)
+
         if self.debug:
             print("------======   RESULT   ======------")
             for line in self.output_data:
                 print(line)
             print("------======   STATS    ======------")
-            print("Program ran for: ", self.time_execution, "seconds.")
\ No newline at end of file
+            print("Program ran for: ", self.time_execution, "seconds.")
+            for name, duration in self.phases.items():
+                print("Phase", name + ":", duration, "seconds.")
+            if self.memory_peak is not None:
+                print("Memory peak: ", self.memory_peak, "bytes.")
+            if self.profiler:
+                print("------======  PROFILE   ======------")
+                print(self.profile_report())
+
+    def stats(self):
+        return {
+            "input_file": self.input_file,
+            "output_file": self.output_file,
+            "time_execution": self.time_execution,
+            "phases": self.phases,
+            "memory_peak": self.memory_peak,
+        }
+
+    def profile_report(self, entries=PROFILE_TOP_ENTRIES):
+        report = io.StringIO()
+        pstats.Stats(self.profiler, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(entries)
+        return report.getvalue()
@@ -1,13 +1,39 @@
+import functools
 import os
-import sys
 
-PROJECT_PATH = "\\".join(os.getcwd().split("\\")[0:-1])
-PARENT_FOLDER_NAME = os.path.basename(os.getcwd())
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY_PREFIX = "Day_"
 FILES_NAME = "io"
 INPUT_FILE = "input.txt"
 SAMPLE_FILE = "sample.txt"
-OUTPUT_FILE = os.path.basename(sys.argv[0])[:-3] + "_output.txt"
+OUTPUT_SUFFIX = "_output.txt"
 
-SAMPLE_PATH = "/".join([PROJECT_PATH, PARENT_FOLDER_NAME, FILES_NAME, SAMPLE_FILE])
-INPUT_PATH = "/".join([PROJECT_PATH, PARENT_FOLDER_NAME, FILES_NAME, INPUT_FILE])
-OUTPUT_PATH = "/".join([PROJECT_PATH, PARENT_FOLDER_NAME, FILES_NAME, OUTPUT_FILE])
+
+@functools.lru_cache(maxsize=None)
+def day_path(day):
+    return os.path.join(PROJECT_PATH, DAY_PREFIX + str(day))
+
+
+@functools.lru_cache(maxsize=None)
+def sample_path(day):
+    return os.path.join(day_path(day), FILES_NAME, SAMPLE_FILE)
+
+
+@functools.lru_cache(maxsize=None)
+def input_path(day):
+    return os.path.join(day_path(day), FILES_NAME, INPUT_FILE)
+
+
+@functools.lru_cache(maxsize=None)
+def output_path(day, part_name):
+    return os.path.join(day_path(day), FILES_NAME, part_name + OUTPUT_SUFFIX)
+
+
+@functools.lru_cache(maxsize=None)
+def solver_paths(solver_file):
+    # [SAMPLE_PATH, INPUT_PATH, OUTPUT_PATH] of a Day_N/<Name>.py solver, derived from its own location, so it does
+    # not matter from where or how the solver is started
+    day = os.path.basename(os.path.dirname(os.path.abspath(solver_file)))[len(DAY_PREFIX):]
+    part_name = os.path.splitext(os.path.basename(solver_file))[0]
+
+    return [sample_path(day), input_path(day), output_path(day, part_name)]
@@ -0,0 +1,56 @@
+#######################################################################################################################
+# Prepare libs
+#######################################################################################################################
+import contextlib
+import glob
+import importlib
+import io
+import os
+import re
+from utils import File, paths
+
+DAY_PATTERN = paths.DAY_PREFIX + "*"
+SOLVER_PATTERN = "*_[AB].py"
+
+
+def day_number(module_name):
+    return int(re.match(r'Day_(\d+)', module_name).group(1))
+
+
+def discover(days=None):
+    # Every Day_N/<Name>_A.py and <Name>_B.py solver as an importable module name, ordered by day and part
+    module_names = []
+    for solver_file in glob.glob(os.path.join(paths.PROJECT_PATH, DAY_PATTERN, SOLVER_PATTERN)):
+        day_folder = os.path.basename(os.path.dirname(solver_file))
+        if not re.fullmatch(r'Day_\d+', day_folder):
+            continue
+        module_names.append(day_folder + "." + os.path.basename(solver_file)[:-3])
+
+    if days:
+        module_names = [module_name for module_name in module_names if day_number(module_name) in days]
+
+    return sorted(module_names, key=lambda module_name: (day_number(module_name), module_name))
+
+
+def input_path(module_name):
+    return paths.input_path(day_number(module_name))
+
+
+def expected_output_path(module_name):
+    return paths.output_path(day_number(module_name), module_name.split(".")[1])
+
+
+def run(module_name, solver_input_path, solver_output_path):
+    # Solvers read their paths from module globals, so they are pointed at the requested files while running
+    module = importlib.import_module(module_name)
+    original_paths = [module.INPUT_PATH, module.OUTPUT_PATH]
+    module.INPUT_PATH = solver_input_path
+    module.OUTPUT_PATH = solver_output_path
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.__main__()
+    finally:
+        module.INPUT_PATH, module.OUTPUT_PATH = original_paths
+
+    return File.read(solver_output_path)